@@ -482,14 +482,18 @@ class BackupManager:
         checksums = {}
         
         try:
+            md5 = hashlib.md5()
+            sha256 = hashlib.sha256()
+            
+            # Single streaming pass feeding both digests, so large archives
+            # are never held in memory whole
             with open(file_path, 'rb') as f:
-                content = f.read()
-                
-                # MD5
-                checksums['md5'] = hashlib.md5(content).hexdigest()
-                
-                # SHA256
-                checksums['sha256'] = hashlib.sha256(content).hexdigest()
+                while chunk := f.read(1024 * 1024):
+                    md5.update(chunk)
+                    sha256.update(chunk)
+            
+            checksums['md5'] = md5.hexdigest()
+            checksums['sha256'] = sha256.hexdigest()
                 
         except Exception as e:
             logger.error(f"Failed to calculate checksums for {file_path}: {e}")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+SmartArb Engine - Binary Log Viewer
+Render MessagePack log files (logging.binary_logs) as JSON lines
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, BinaryIO
+
+import msgpack
+
+
+def read_frames(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yield decoded entries from a stream of length-prefixed frames"""
+    while True:
+        header = stream.read(4)
+        if len(header) < 4:
+            return
+        length = int.from_bytes(header, 'little')
+        payload = stream.read(length)
+        if len(payload) < length:
+            return
+        yield msgpack.unpackb(payload, raw=False)
+
+
+def open_log(path: Path) -> BinaryIO:
+    """Open a binary log, transparently handling rotated .gz files"""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Render SmartArb binary logs as JSON')
+    parser.add_argument('files', nargs='+', type=Path, help='Binary log files (.bin or .bin.N.gz)')
+    parser.add_argument('--level', help='Only show records of this level (e.g. ERROR)')
+    args = parser.parse_args()
+
+    for path in args.files:
+        with open_log(path) as stream:
+            for entry in read_frames(stream):
+                if args.level and entry.get('level') != args.level.upper():
+                    continue
+                sys.stdout.write(json.dumps(entry, default=str) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -43,7 +43,8 @@ install_requires = read_requirements('requirements.txt')
 # Development requirements
 dev_requires = [
     'pytest>=8.3.3',
-    'pytest-asyncio>=0.24.0',
+    'pytest-asyncio-cooperative>=0.37.0',
+    'pytest-xdist>=3.5.0',
     'pytest-mock>=3.14.0',
     'pytest-cov>=5.0.0',
     'black>=24.10.0',
@@ -80,8 +81,19 @@ prod_requires = [
     'grafana-api>=1.0.3',
 ]
 
+# Binary (MessagePack) log output requirements
+binlog_requires = [
+    'msgpack>=1.0.0',
+]
+
+# Persistent SMTP connection for email notifications
+email_requires = [
+    'aiosmtplib>=2.0.0',
+]
+
 # All extras
-all_requires = dev_requires + rpi_requires + ai_requires + prod_requires
+all_requires = (dev_requires + rpi_requires + ai_requires + prod_requires
+                + binlog_requires + email_requires)
 
 setup(
     name="smartarb-engine",
@@ -112,6 +124,8 @@ setup(
         'rpi': rpi_requires,
         'ai': ai_requires,
         'prod': prod_requires,
+        'binlog': binlog_requires,
+        'email': email_requires,
         'all': all_requires,
     },
     
@@ -26,6 +26,10 @@ class Priority(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    def __init__(self, value):
+        # Sort rank (CRITICAL first) as a plain int on each member
+        self.rank = ('critical', 'high', 'medium', 'low').index(value)
+
 class AdviceType(Enum):
     """Types of AI advice"""
     RISK_MANAGEMENT = "risk_management"
@@ -311,9 +315,8 @@ class SmartArbAIAdvisor:
                 active_recommendations.append(rec)
             
             # Sort by priority and timestamp
-            priority_order = {Priority.CRITICAL: 0, Priority.HIGH: 1, Priority.MEDIUM: 2, Priority.LOW: 3}
             active_recommendations.sort(
-                key=lambda x: (priority_order[x.priority], x.timestamp), 
+                key=lambda x: (x.priority.rank, x.timestamp), 
                 reverse=True
             )
             
@@ -161,6 +161,7 @@ class AIIntegrationManager:
         if not suggestions:
             return
         
+        telegram_sends = []
         for suggestion in suggestions:
             # Aggiunge alla lista attiva
             self.ai_advisor.add_suggestion_to_active(suggestion)
@@ -171,7 +172,11 @@ class AIIntegrationManager:
             # Invio notifica Telegram per alta priorità
             if (suggestion.priority >= self.config.high_priority_threshold and 
                 self.config.auto_telegram_alerts and self.telegram):
-                await self._send_telegram_suggestion(suggestion, context)
+                telegram_sends.append(self._send_telegram_suggestion(suggestion, context))
+        
+        # Invii indipendenti: le latenze si sovrappongono invece di sommarsi
+        if telegram_sends:
+            await asyncio.gather(*telegram_sends)
     
     async def _send_telegram_suggestion(self, suggestion: AISuggestion, context: Dict[str, Any] = None):
         """Invia suggerimento tramite Telegram"""
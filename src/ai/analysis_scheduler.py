@@ -4,7 +4,7 @@ Automated scheduling and execution of Claude AI analysis tasks
 “””
 
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import time
@@ -568,7 +568,32 @@ async def trigger_analysis(self, analysis_type: AnalysisType,
                          priority: str = "medium") -> str:
     """Manually trigger an analysis"""
     trigger_id = f"manual_{analysis_type.value}_{int(time.time())}"
+    self._add_manual_trigger(trigger_id, analysis_type, priority)
     
+    logger.info("manual_analysis_triggered",
+               trigger_id=trigger_id,
+               analysis_type=analysis_type.value,
+               priority=priority)
+    
+    return trigger_id
+
+async def trigger_analyses(self, requests: List[Tuple[AnalysisType, str]]) -> List[str]:
+    """Manually trigger several analyses in one call"""
+    now = int(time.time())
+    trigger_ids = []
+    
+    for index, (analysis_type, priority) in enumerate(requests):
+        # Index keeps IDs unique when one batch repeats a type within a second
+        trigger_id = f"manual_{analysis_type.value}_{now}_{index}"
+        self._add_manual_trigger(trigger_id, analysis_type, priority)
+        trigger_ids.append(trigger_id)
+    
+    logger.info("manual_analyses_triggered", count=len(trigger_ids))
+    
+    return trigger_ids
+
+def _add_manual_trigger(self, trigger_id: str, analysis_type: AnalysisType, priority: str) -> None:
+    """Register a manual trigger and queue it for execution"""
     manual_trigger = AnalysisTrigger(
         id=trigger_id,
         name=f"Manual {analysis_type.value}",
@@ -582,13 +607,6 @@ async def trigger_analysis(self, analysis_type: AnalysisType,
     # Add to execution queue immediately
     self.execution_queue.append(trigger_id)
     self.triggers[trigger_id] = manual_trigger
-    
-    logger.info("manual_analysis_triggered",
-               trigger_id=trigger_id,
-               analysis_type=analysis_type.value,
-               priority=priority)
-    
-    return trigger_id
 
 async def emergency_trigger(self, reason: str, system_state: Dict[str, Any]) -> str:
     """Trigger emergency analysis"""
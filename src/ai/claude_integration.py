@@ -37,7 +37,7 @@ PORTFOLIO_REBALANCE = “portfolio_rebalance”
 EMERGENCY_ACTION = “emergency_action”
 OPTIMIZATION = “optimization”
 
-@dataclass
+@dataclass(slots=True)
 class AIRecommendation:
 “”“AI recommendation structure”””
 id: str
@@ -1,9 +1,70 @@
 """Code Updater"""
 
+import ast
+import re
+
+# Constructs AI-suggested code may never contain, matched in a single pass
+# before the code is parsed
+_UNSAFE_RE = re.compile(
+    r"os\.system|subprocess\.|__import__|(?<![\w.])(?:exec|eval|compile)\("
+)
+
+# Builtins AI-suggested code may never call by name; getattr and friends
+# are here because they reach anything else by a computed string
+_FORBIDDEN_CALLS = frozenset({
+    'exec', 'eval', 'compile', '__import__', 'open', 'breakpoint',
+    'getattr', 'setattr', 'delattr', 'globals', 'locals', 'vars',
+})
+
+# Modules whose names may not appear at all, so neither os.system(...) nor
+# run = subprocess.run gets through
+_FORBIDDEN_MODULES = frozenset({
+    'os', 'sys', 'subprocess', 'shutil', 'socket', 'ctypes',
+    'importlib', 'builtins', 'pickle', 'marshal',
+})
+
+# Functions whose bodies are never changed automatically
+_PROTECTED_FUNCTIONS = frozenset({
+    'place_order',
+    'cancel_order',
+    'execute_order',
+    'execute_arbitrage',
+})
+
+
+def _unsafe_node(node: ast.AST) -> bool:
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return True
+    if isinstance(node, ast.Name):
+        # Dunder names cover __builtins__ and __import__ lookups
+        return node.id in _FORBIDDEN_MODULES or node.id.startswith('__')
+    if isinstance(node, ast.Attribute):
+        # obj.__class__.__subclasses__() and the like
+        return node.attr.startswith('__')
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return node.func.id in _FORBIDDEN_CALLS
+    return False
+
+
 class CodeUpdater:
     def __init__(self, config, database_manager):
         self.config = config
         self.database_manager = database_manager
-    
+
     async def initialize(self):
         return True
+
+    def _is_code_safe(self, code: str) -> bool:
+        """True when code parses and uses no forbidden construct"""
+        if _UNSAFE_RE.search(code):
+            return False
+        try:
+            # Suggestions are often single statements lifted from a coroutine
+            tree = compile(code, '<suggested>', 'exec',
+                           flags=ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+        except SyntaxError:
+            return False
+        return not any(_unsafe_node(node) for node in ast.walk(tree))
+
+    def _is_protected_function(self, name: str) -> bool:
+        return name in _PROTECTED_FUNCTIONS
@@ -17,7 +17,7 @@ from datetime import datetime, timedelta
 
 # Import configuration
 from src.config.config_manager import AppConfig, ExchangeConfig, StrategyConfig
-from src.core.logger import get_logger, log_trade_activity
+from src.core.logger import get_logger, log_trade_activity, trade_logging_enabled
 from src.notifications.telegram_notifier import TelegramNotifier, NotificationConfig
 
 class SmartArbEngine:
@@ -291,12 +291,13 @@ class SmartArbEngine:
                     self.active_strategies[strategy_name]['opportunities_found'] += 1
                     
                     # Log opportunity
-                    log_trade_activity(
-                        f"🎯 OPPORTUNITY FOUND: {opportunity['pair']} | "
-                        f"{opportunity['buy_exchange'].upper()} → {opportunity['sell_exchange'].upper()} | "
-                        f"Spread: {opportunity['spread_percent']:.2f}% | "
-                        f"Profit: ${opportunity['potential_profit']:.2f}"
-                    )
+                    if trade_logging_enabled():
+                        log_trade_activity(
+                            f"🎯 OPPORTUNITY FOUND: {opportunity['pair']} | "
+                            f"{opportunity['buy_exchange'].upper()} → {opportunity['sell_exchange'].upper()} | "
+                            f"Spread: {opportunity['spread_percent']:.2f}% | "
+                            f"Profit: ${opportunity['potential_profit']:.2f}"
+                        )
                     
                     # Send Telegram notification
                     if self.telegram:
@@ -324,11 +325,12 @@ class SmartArbEngine:
             'timestamp': time.time()
         }
         
-        log_trade_activity(
-            f"📄 PAPER TRADE EXECUTED: {trade['pair']} | "
-            f"Profit: ${profit:.2f} | "
-            f"Total: ${self.stats['total_profit']:.2f}"
-        )
+        if trade_logging_enabled():
+            log_trade_activity(
+                f"📄 PAPER TRADE EXECUTED: {trade['pair']} | "
+                f"Profit: ${profit:.2f} | "
+                f"Total: ${self.stats['total_profit']:.2f}"
+            )
         
         # Send Telegram notification for significant trades
         if self.telegram:
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from enum import Enum
+from collections import deque
 import structlog
 import time
 from datetime import datetime, timedelta
@@ -62,7 +63,7 @@ def to_dict(self) -> Dict[str, Any]:
     }
 ```
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
 “”“Execution result structure”””
 plan_id: str
@@ -641,8 +642,8 @@ def __init__(self, exchanges: Dict[str, BaseExchange],
     
     # Execution tracking
     self.active_executions = {}
-    self.execution_history = []
     self.max_history_size = 1000
+    self.execution_history = deque(maxlen=self.max_history_size)
     
     # Performance metrics
     self.total_executions = 0
@@ -726,11 +727,8 @@ async def execute_single_order(self, exchange_name: str, order_spec: Dict[str, A
 def _add_to_history(self, result: ExecutionResult):
     """Add execution result to history"""
     
+    # Oldest results drop off automatically once the deque is full
     self.execution_history.append(result)
-    
-    # Manage history size
-    if len(self.execution_history) > self.max_history_size:
-        self.execution_history = self.execution_history[-self.max_history_size:]
 
 def get_execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
     """Get status of specific execution"""
@@ -102,9 +102,18 @@ def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name"""
     return logging.getLogger(f'smartarb.{name}')
 
+# Shared trading logger, bound once at import
+trading_logger = logging.getLogger('smartarb.trading')
+
+def trade_logging_enabled() -> bool:
+    """Check whether the trading log accepts INFO records
+
+    Lets hot paths skip building the message when trading logs are off.
+    """
+    return trading_logger.isEnabledFor(logging.INFO)
+
 def log_trade_activity(message: str) -> None:
     """Log trading activity to dedicated trading log"""
-    trading_logger = logging.getLogger('smartarb.trading')
     trading_logger.info(message)
 
 class PerformanceLogger:
@@ -117,22 +126,30 @@ class PerformanceLogger:
     def start_timer(self, operation: str) -> None:
         """Start timing an operation"""
         import time
-        self.start_times[operation] = time.time()
-        self.logger.debug(f"⏱️  Started timing: {operation}")
+        self.start_times[operation] = time.perf_counter_ns()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"⏱️  Started timing: {operation}")
     
     def end_timer(self, operation: str) -> float:
         """End timing an operation and log the duration"""
         import time
         if operation in self.start_times:
-            duration = time.time() - self.start_times[operation]
-            self.logger.info(f"⏱️  {operation}: {duration:.3f}s")
+            duration = (time.perf_counter_ns() - self.start_times[operation]) / 1e9
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"⏱️  {operation}: {duration:.3f}s")
             del self.start_times[operation]
             return duration
         return 0.0
     
     def log_metric(self, metric_name: str, value: float, unit: str = ""):
         """Log a performance metric"""
-        self.logger.info(f"📊 {metric_name}: {value}{unit}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"📊 {metric_name}: {value}{unit}")
 
 # Global performance logger instance
 performance_logger = PerformanceLogger()
+
+__all__ = [
+    'setup_logging', 'get_logger', 'log_trade_activity', 'trade_logging_enabled',
+    'PerformanceLogger', 'performance_logger', 'trading_logger'
+]
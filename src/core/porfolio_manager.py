@@ -18,6 +18,9 @@ from ..exchanges.base_exchange import BaseExchange, Balance
 
 logger = structlog.get_logger(**name**)
 
+# Shared zero for balance accumulators, parsed once instead of per asset
+_ZERO = Decimal('0')
+
 class AssetType(Enum):
 “”“Asset type enumeration”””
 FIAT = “fiat”
@@ -124,7 +127,7 @@ async def get_price(self, symbol: str, base: str = "USD") -> Decimal:
     
     # Default fallback
     self.logger.warning("price_not_found", symbol=symbol, base=base)
-    return Decimal('0')
+    return _ZERO
 
 async def update_prices(self, exchanges: Dict[str, BaseExchange]):
     """Update prices from exchanges"""
@@ -267,7 +270,7 @@ async def update_portfolio(self) -> PortfolioSnapshot:
         portfolio_assets = await self._aggregate_asset_balances(all_balances)
         
         # Calculate USD values
-        total_value_usd = Decimal('0')
+        total_value_usd = _ZERO
         for asset in portfolio_assets.values():
             asset.usd_value = await self._calculate_asset_value(asset)
             total_value_usd += asset.usd_value
@@ -319,9 +322,9 @@ async def update_portfolio(self) -> PortfolioSnapshot:
         else:
             return PortfolioSnapshot(
                 timestamp=current_time,
-                total_value_usd=Decimal('0'),
+                total_value_usd=_ZERO,
                 assets={},
-                pnl_24h=Decimal('0'),
+                pnl_24h=_ZERO,
                 pnl_percentage_24h=0.0,
                 exchange_breakdown={}
             )
@@ -369,9 +372,9 @@ async def _aggregate_asset_balances(self, all_balances: Dict[str, Dict[str, Bala
     
     # Aggregate each asset
     for asset in all_assets:
-        total_balance = Decimal('0')
-        available_balance = Decimal('0')
-        locked_balance = Decimal('0')
+        total_balance = _ZERO
+        available_balance = _ZERO
+        locked_balance = _ZERO
         exchanges = {}
         
         for exchange_name, exchange_balances in all_balances.items():
@@ -388,7 +391,7 @@ async def _aggregate_asset_balances(self, all_balances: Dict[str, Dict[str, Bala
                 total_balance=total_balance,
                 available_balance=available_balance,
                 locked_balance=locked_balance,
-                usd_value=Decimal('0'),  # Will be calculated later
+                usd_value=_ZERO,  # Will be calculated later
                 percentage=0.0,  # Will be calculated later
                 exchanges=exchanges,
                 last_updated=time.time()
@@ -400,14 +403,14 @@ async def _calculate_asset_value(self, asset: PortfolioAsset) -> Decimal:
     """Calculate USD value of asset"""
     
     if asset.total_balance == 0:
-        return Decimal('0')
+        return _ZERO
     
     # Get asset price in USD
     price_usd = await self.price_provider.get_price(asset.symbol, "USD")
     
     if price_usd == 0:
         self.logger.warning("asset_price_unavailable", asset=asset.symbol)
-        return Decimal('0')
+        return _ZERO
     
     return asset.total_balance * price_usd
 
@@ -417,7 +420,7 @@ async def _calculate_exchange_breakdown(self, all_balances: Dict[str, Dict[str,
     breakdown = {}
     
     for exchange_name, exchange_balances in all_balances.items():
-        exchange_value = Decimal('0')
+        exchange_value = _ZERO
         
         for asset, balance in exchange_balances.items():
             if balance.total > 0:
@@ -442,7 +445,7 @@ def _calculate_24h_pnl(self, current_value: Decimal) -> Tuple[Decimal, float]:
             break
     
     if baseline_value is None or baseline_value == 0:
-        return Decimal('0'), 0.0
+        return _ZERO, 0.0
     
     pnl_24h = current_value - baseline_value
     pnl_percentage_24h = float(pnl_24h / baseline_value * 100)
@@ -5,7 +5,8 @@ Comprehensive risk management with multiple safety layers and real-time monitori
 “””
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from enum import Enum
@@ -19,6 +20,11 @@ from ..exchanges.base_exchange import BaseExchange
 
 logger = structlog.get_logger(**name**)
 
+# Decimal constants for per-opportunity checks, parsed once instead of per call
+_ZERO = Decimal('0')
+_DEFAULT_POSITION_FRACTION = Decimal('0.01')  # 1% of portfolio
+_DEFAULT_PORTFOLIO_VALUE = Decimal('10000')  # 10k USDT
+
 class RiskLevel(Enum):
 “”“Risk level enumeration”””
 LOW = “low”
@@ -70,7 +76,7 @@ def __init__(self, config: Dict[str, Any]):
     self.triggered = False
     self.trigger_time = None
     self.total_loss = Decimal('0')
-    self.trade_history = []
+    self.trade_history: Deque[Tuple[float, Decimal]] = deque()  # (timestamp, profit_loss)
     
     self.logger = structlog.get_logger("risk.circuit_breaker")
 
@@ -78,22 +84,14 @@ def add_trade_result(self, profit_loss: Decimal):
     """Add trade result for monitoring"""
     current_time = time.time()
     
-    self.trade_history.append({
-        'timestamp': current_time,
-        'profit_loss': profit_loss
-    })
+    self.trade_history.append((current_time, profit_loss))
+    self.total_loss += profit_loss
     
-    # Clean old trades outside lookback window
+    # Expire trades outside the lookback window from the oldest end,
+    # keeping the running total in step; a zero window expires them all
     cutoff_time = current_time - (self.lookback_minutes * 60)
-    self.trade_history = [
-        trade for trade in self.trade_history 
-        if trade['timestamp'] > cutoff_time
-    ]
-    
-    # Calculate total loss in lookback period
-    self.total_loss = sum(
-        trade['profit_loss'] for trade in self.trade_history
-    )
+    while self.trade_history and self.trade_history[0][0] <= cutoff_time:
+        self.total_loss -= self.trade_history.popleft()[1]
     
     # Check if circuit breaker should trigger
     if self.enabled and self.total_loss <= self.loss_threshold and not self.triggered:
@@ -114,7 +112,7 @@ def reset(self):
     self.triggered = False
     self.trigger_time = None
     self.total_loss = Decimal('0')
-    self.trade_history = []
+    self.trade_history.clear()
     
     self.logger.info("circuit_breaker_reset")
 
@@ -198,7 +196,7 @@ def _kelly_position_size(self, portfolio_value: Decimal,
                        win_rate: float, avg_win: float, avg_loss: float) -> Decimal:
     """Calculate position size using Kelly Criterion"""
     if win_rate <= 0 or avg_loss <= 0:
-        return portfolio_value * Decimal('0.01')  # 1% default
+        return portfolio_value * _DEFAULT_POSITION_FRACTION
     
     # Kelly fraction = (bp - q) / b
     # where b = avg_win/avg_loss, p = win_rate, q = 1 - win_rate
@@ -464,7 +462,7 @@ async def _assess_concentration_risk(self, opportunity) -> RiskMetric:
     description_parts = []
     
     # Check exposure to this symbol
-    symbol_exposure = self.active_positions.get(opportunity.symbol, Decimal('0'))
+    symbol_exposure = self.active_positions.get(opportunity.symbol, _ZERO)
     total_portfolio = self._get_total_portfolio_value()
     
     if total_portfolio > 0:
@@ -574,12 +572,12 @@ def _get_total_portfolio_value(self) -> Decimal:
     """Get total portfolio value across all exchanges"""
     # Placeholder implementation
     # In practice, sum balances from all exchanges
-    return Decimal('10000')  # Default 10k USDT
+    return _DEFAULT_PORTFOLIO_VALUE
 
 def _get_exchange_exposure(self, exchange_name: str) -> Decimal:
     """Get current exposure on specific exchange"""
     # Placeholder implementation
-    return Decimal('0')
+    return _ZERO
 
 def add_trade_result(self, profit_loss: Decimal, symbol: str):
     """Add trade result for risk tracking"""
@@ -87,8 +87,8 @@ def __init__(self, exchanges: Dict[str, BaseExchange], config: Dict[str, Any]):
     self.preferred_pairs = self.config.get('preferred_pairs', [])
     self.trading_pairs = set(self.config.get('trading_pairs', []))
     
-    # Opportunity tracking
-    self.active_opportunities = {}
+    # Opportunity tracking, keyed by (symbol, buy_exchange, sell_exchange)
+    self.active_opportunities: Dict[Tuple[str, str, str], ArbitrageOpportunity] = {}
     self.opportunity_history = []
     
     self.logger = structlog.get_logger("strategy.spatial_arbitrage")
@@ -343,13 +343,10 @@ def _rank_opportunities(self, opportunities: List[ArbitrageOpportunity]) -> List
 
 def _is_duplicate_opportunity(self, opportunity: ArbitrageOpportunity) -> bool:
     """Check if similar opportunity already exists"""
-    for existing_opp in self.active_opportunities.values():
-        if (existing_opp.symbol == opportunity.symbol and
-            existing_opp.buy_exchange == opportunity.buy_exchange and
-            existing_opp.sell_exchange == opportunity.sell_exchange and
-            not existing_opp.is_expired):
-            return True
-    return False
+    existing_opp = self.active_opportunities.get(
+        (opportunity.symbol, opportunity.buy_exchange, opportunity.sell_exchange)
+    )
+    return existing_opp is not None and not existing_opp.is_expired
 
 def _is_preferred_exchange_pair(self, exchange1: str, exchange2: str) -> bool:
     """Check if exchange pair is in preferences"""
@@ -14,6 +14,7 @@ from typing import Dict, Any, Optional, AsyncGenerator
 import structlog
 
 from .models import Base, create_tables
+from ..utils.async_cache import async_ttl
 
 logger = structlog.get_logger(__name__)
 
@@ -193,8 +194,13 @@ class DatabaseManager:
         finally:
             await redis_client.close()
     
+    @async_ttl(ttl=0.25)
     async def health_check(self) -> Dict[str, Any]:
-        """Check health of all database connections"""
+        """Check health of all database connections
+
+        Results are reused for 250ms and concurrent callers share one probe,
+        so per-component health loops do not each round-trip to the servers.
+        """
         health_status = {
             'postgresql': {'healthy': False, 'error': None},
             'redis': {'healthy': False, 'error': None}
@@ -238,6 +244,7 @@ class DatabaseManager:
             self.redis_pool = None
         
         self.is_connected = False
+        DatabaseManager.health_check.cache_clear(self)
         logger.info("database_connections_closed")
 
 
@@ -15,6 +15,12 @@ import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:  # not installed, or Windows
+    HAS_UVLOOP = False
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -137,6 +143,10 @@ if __name__ == "__main__":
     if not os.getenv('LOG_LEVEL'):
         os.environ['LOG_LEVEL'] = 'DEBUG'
     
+    # libuv-based loop for the exchange I/O when available
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the application
     try:
         asyncio.run(main())
@@ -41,6 +41,15 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     print("⚠️ psutil not available - system stats disabled")
 
+# Faster JSON encoding when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
 class AlertLevel(Enum):
     """Alert priority levels"""
     LOW = ("🔵", 300)        # 5 min cooldown
@@ -79,10 +88,13 @@ class SmartArbTelegramBot:
             'uptime_start': datetime.now()
         }
         
-        # Rate limiting settings
+        # Rate limiting settings: token bucket holding up to an hour's worth
+        # of alerts, refilled continuously at max_alerts_per_hour / 3600 per second
         self.max_alerts_per_hour = int(os.getenv('TELEGRAM_MAX_NOTIFICATIONS_PER_HOUR', '15'))
-        self.hour_counter = 0
-        self.hour_reset_time = datetime.now()
+        self.min_profit_threshold = float(os.getenv('TELEGRAM_MIN_PROFIT_THRESHOLD', '25'))
+        self._refill_rate = self.max_alerts_per_hour / 3600.0
+        self._tokens = float(self.max_alerts_per_hour)
+        self._last_refill = time.monotonic()
         
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
@@ -99,26 +111,26 @@ class SmartArbTelegramBot:
         if alert_level == AlertLevel.EMERGENCY:
             return True  # Never rate limit emergencies
             
-        # Reset hourly counter
-        now = datetime.now()
-        if (now - self.hour_reset_time).total_seconds() >= 3600:
-            self.hour_counter = 0
-            self.hour_reset_time = now
+        # Refill the hourly budget
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_alerts_per_hour),
+            self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
             
         # Check hourly limit
-        if self.hour_counter >= self.max_alerts_per_hour:
+        if self._tokens < 1:
             return False
             
         # Check cooldown for this alert type
         alert_key = alert_level.name
         last_time = self.last_alert_time.get(alert_key)
-        if last_time:
-            elapsed = (now - last_time).total_seconds()
-            if elapsed < alert_level.cooldown:
-                return False
+        if last_time is not None and now - last_time < alert_level.cooldown:
+            return False
                 
         # Update counters
-        self.hour_counter += 1
+        self._tokens -= 1
         self.last_alert_time[alert_key] = now
         return True
     
@@ -150,10 +162,11 @@ class SmartArbTelegramBot:
             'disable_notification': silent,
             'disable_web_page_preview': True
         }
+        body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8')
         
         for attempt in range(3):  # 3 retry attempts
             try:
-                async with self.session.post(url, json=payload) as response:
+                async with self.session.post(url, data=body, headers=JSON_HEADERS) as response:
                     if response.status == 200:
                         return True
                     else:
@@ -169,18 +182,19 @@ class SmartArbTelegramBot:
     
     async def alert_trade_executed(self, trade_data: Dict) -> bool:
         """Alert for executed trades"""
+        profit = trade_data.get('profit', 0)
+        
+        # Only alert for significant profits; checked first so small trades
+        # don't use up the rate-limit budget
+        if profit < self.min_profit_threshold:
+            return False
+            
         if not self._check_rate_limit(AlertLevel.HIGH):
             return False
             
-        profit = trade_data.get('profit', 0)
         pair = trade_data.get('pair', 'N/A')
         amount = trade_data.get('amount', 0)
         
-        # Only alert for significant profits
-        min_profit = float(os.getenv('TELEGRAM_MIN_PROFIT_THRESHOLD', '25'))
-        if profit < min_profit:
-            return False
-            
         message = f"""
 🎯 <b>TRADE EXECUTED</b> {AlertLevel.HIGH.emoji}
 
@@ -286,7 +300,7 @@ class SmartArbTelegramBot:
 ⏰ <b>Started:</b> {datetime.now().strftime('%H:%M:%S')}
 
 🔔 <b>Alert Settings:</b>
-- Min Profit: ${os.getenv('TELEGRAM_MIN_PROFIT_THRESHOLD', '25')}
+- Min Profit: ${self.min_profit_threshold:g}
 - Max Alerts/Hour: {self.max_alerts_per_hour}
 
 🎯 <b>Ready for live trading notifications!</b>
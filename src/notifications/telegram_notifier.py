@@ -8,13 +8,49 @@ import asyncio
 import aiohttp
 import json
 import os
+import ssl
+import time
 import logging
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from ..core.logger import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Message priorities, highest first
+PRIORITY_ORDER = ('urgent', 'high', 'medium', 'low')
+
+# Coalescing of queued messages into one sendMessage call
+MAX_MESSAGE_LENGTH = 4096  # Telegram's limit for a single message
+MAX_BATCH_SIZE = 20
+BATCH_SEPARATOR = '\n\n———\n\n'
+
+# Last formatted wall-clock second per format string
+_clock_cache: Dict[str, Tuple[int, str]] = {}
+
+def _clock(fmt: str = '%H:%M:%S') -> str:
+    """Format the current local time, reusing the result within the same second"""
+    now = int(time.time())
+    cached = _clock_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = _clock_cache[fmt] = (now, time.strftime(fmt, time.localtime(now)))
+    return cached[1]
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
 @dataclass
 class NotificationConfig:
     """Configuration for Telegram notifications"""
@@ -35,13 +71,16 @@ class TelegramNotifier:
         self.logger = get_logger('telegram')
         self.session: Optional[aiohttp.ClientSession] = None
         
-        # Rate limiting
-        self.notification_count = 0
-        self.last_reset_time = datetime.now()
+        # Rate limiting: sliding one-hour window of 60 one-minute buckets
+        self._rate_buckets: Deque[int] = deque([0] * 60, maxlen=60)
+        self._bucket_minute = int(time.monotonic() // 60)
+        self._window_count = 0
         self.last_status_report = datetime.now()
         
-        # Message queuing
-        self.message_queue = []
+        # Message queuing: one FIFO lane per priority
+        self.message_queue: Dict[str, Deque[Dict[str, Any]]] = {
+            priority: deque() for priority in PRIORITY_ORDER
+        }
         self.is_sending = False
         
         # Statistics
@@ -63,7 +102,15 @@ class TelegramNotifier:
         if not self.config.enabled:
             return
             
-        self.session = aiohttp.ClientSession()
+        # Keep-alive connector with a shared SSL context so the TLS handshake
+        # to api.telegram.org is paid once per connection, not per message
+        self._ssl_ctx = ssl.create_default_context()
+        connector = aiohttp.TCPConnector(
+            ssl=self._ssl_ctx,
+            keepalive_timeout=120,
+            limit_per_host=4
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
         
         # Send startup message
         await self._send_startup_message()
@@ -168,46 +215,73 @@ class TelegramNotifier:
     
     def _check_rate_limit(self) -> bool:
         """Check if we can send another notification"""
-        now = datetime.now()
+        minute = int(time.monotonic() // 60)
         
-        # Reset counter every hour
-        if (now - self.last_reset_time).seconds >= 3600:
-            self.notification_count = 0
-            self.last_reset_time = now
+        # Slide the window forward; buckets older than an hour drop off the left
+        elapsed = minute - self._bucket_minute
+        if elapsed:
+            for _ in range(min(elapsed, 60)):
+                self._window_count -= self._rate_buckets[0]
+                self._rate_buckets.append(0)
+            self._bucket_minute = minute
         
-        if self.notification_count >= self.config.max_notifications_per_hour:
+        if self._window_count >= self.config.max_notifications_per_hour:
             return False
             
-        self.notification_count += 1
+        self._rate_buckets[-1] += 1
+        self._window_count += 1
         return True
     
+    def _enqueue(self, message_data: Dict[str, Any]):
+        """Append a message to the lane for its priority"""
+        lane = self.message_queue.get(message_data['priority'], self.message_queue['medium'])
+        lane.append(message_data)
+    
+    def _next_batch(self) -> Optional[Dict[str, Any]]:
+        """Pop the next message, merging queued messages of the same lane into it"""
+        for lane in self.message_queue.values():
+            if lane:
+                break
+        else:
+            return None
+        
+        first = lane.popleft()
+        parts = [first['message']]
+        length = len(first['message'])
+        while lane and len(parts) < MAX_BATCH_SIZE:
+            extra = len(BATCH_SEPARATOR) + len(lane[0]['message'])
+            if length + extra > MAX_MESSAGE_LENGTH:
+                break
+            parts.append(lane.popleft()['message'])
+            length += extra
+        
+        if len(parts) > 1:
+            first['message'] = BATCH_SEPARATOR.join(parts)
+        return first
+    
     async def _queue_message(self, message: str, priority: str = 'medium'):
         """Queue message for sending"""
-        self.message_queue.append({
+        self._enqueue({
             'message': message,
             'priority': priority,
             'timestamp': datetime.now(),
             'retries': 0
         })
-        
-        # Sort queue by priority
-        priority_order = {'urgent': 0, 'high': 1, 'medium': 2, 'low': 3}
-        self.message_queue.sort(key=lambda x: priority_order.get(x['priority'], 2))
     
     async def _process_message_queue(self):
         """Process queued messages"""
         while True:
             try:
-                if self.message_queue and not self.is_sending:
+                message_data = None if self.is_sending else self._next_batch()
+                if message_data:
                     self.is_sending = True
                     
-                    message_data = self.message_queue.pop(0)
                     success = await self._send_message(message_data['message'])
                     
                     if not success and message_data['retries'] < 3:
                         # Re-queue with retry
                         message_data['retries'] += 1
-                        self.message_queue.append(message_data)
+                        self._enqueue(message_data)
                         self.logger.warning(f"📱 Retrying message: {message_data['retries']}")
                     
                     self.is_sending = False
@@ -235,7 +309,7 @@ class TelegramNotifier:
         }
         
         try:
-            async with self.session.post(url, json=payload) as response:
+            async with self.session.post(url, data=_dumps(payload), headers=JSON_HEADERS) as response:
                 if response.status == 200:
                     self.stats['notifications_sent'] += 1
                     self.stats['last_notification'] = datetime.now()
@@ -262,7 +336,7 @@ class TelegramNotifier:
 🔄 <b>Route:</b> {buy_exchange.upper()} → {sell_exchange.upper()}
 📈 <b>Spread:</b> {spread:.2f}%
 💰 <b>Profit:</b> ${profit:.2f}
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 💡 <i>Opportunity detected by SmartArb Engine</i>"""
         
@@ -279,7 +353,7 @@ class TelegramNotifier:
 💱 <b>Pair:</b> {pair}
 💰 <b>Profit:</b> ${profit:.2f}
 📊 <b>Total:</b> ${total_profit:.2f}
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 🚀 <i>Paper trade completed successfully</i>"""
         
@@ -311,7 +385,7 @@ class TelegramNotifier:
         message = f"""🚨 <b>SYSTEM {error_type}</b>
         
 ❌ <b>Error:</b> {error_message}
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 🔧 <i>Check system logs for details</i>"""
         
@@ -324,7 +398,7 @@ class TelegramNotifier:
             
 💰 <b>Total Profit:</b> ${value:.2f}
 🎉 <b>Achievement:</b> New profit record!
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 🚀 <i>SmartArb Engine performing excellently!</i>"""
         
@@ -333,7 +407,7 @@ class TelegramNotifier:
             
 📈 <b>Total Trades:</b> {value}
 🏆 <b>Achievement:</b> New trade count record!
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 💪 <i>Trading machine in full swing!</i>"""
         
@@ -341,7 +415,7 @@ class TelegramNotifier:
             message = f"""🎉 <b>MILESTONE: {milestone_type.upper()}</b>
             
 🏆 <b>Value:</b> {value}
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"""
+⏰ <b>Time:</b> {_clock()}"""
         
         return message
     
@@ -350,7 +424,7 @@ class TelegramNotifier:
         message = f"""🚀 <b>SMARTARB ENGINE STARTED</b>
         
 ✅ <b>Status:</b> Online
-⏰ <b>Time:</b> {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+⏰ <b>Time:</b> {_clock('%d/%m/%Y %H:%M:%S')}
 🎯 <b>Mode:</b> Active Trading
 📱 <b>Notifications:</b> Enabled
 
@@ -366,7 +440,7 @@ class TelegramNotifier:
 📱 Notifications sent: {self.stats['notifications_sent']}
 🎯 Opportunities reported: {self.stats['opportunities_reported']}
 ❌ Errors reported: {self.stats['errors_reported']}
-⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Time:</b> {_clock()}
 
 👋 <i>System shutdown complete</i>"""
         
@@ -4,8 +4,10 @@ Complete implementation of cross-exchange arbitrage opportunities detection and
 “””
 
 import asyncio
+from collections import deque
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Any
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import structlog
@@ -16,6 +18,16 @@ from .base_strategy import BaseStrategy, Opportunity, OpportunityType, Opportuni
 
 logger = structlog.get_logger(**name**)
 
+# Decimal constants for the scan path, parsed once instead of per call
+_ZERO = Decimal('0')
+_DEFAULT_TAKER_FEE = Decimal('0.001')  # 0.1%
+_BALANCE_BUFFER = Decimal('1.01')  # 1% buffer
+_BASE_RISK = Decimal('0.1')
+_VOLATILITY_RISK = Decimal('0.2')
+_THIN_BOOK_RISK = Decimal('0.3')
+_STALE_DATA_RISK = Decimal('0.2')
+_MAX_RISK = Decimal('1.0')
+
 @dataclass
 class SpatialOpportunity(Opportunity):
 “”“Spatial arbitrage opportunity data”””
@@ -56,7 +68,7 @@ self.timestamp = max(ticker.timestamp, orderbook.timestamp)
     self.bid_depth = sum(level.amount for level in orderbook.bids[:5])  # Top 5 levels
     self.ask_depth = sum(level.amount for level in orderbook.asks[:5])
     self.spread = ticker.ask - ticker.bid
-    self.spread_percent = (self.spread / ticker.ask * 100) if ticker.ask > 0 else Decimal('0')
+    self.spread_percent = (self.spread / ticker.ask * 100) if ticker.ask > 0 else _ZERO
 ```
 
 class SpatialArbitrageStrategy(BaseStrategy):
@@ -103,8 +115,8 @@ def __init__(self, exchanges: Dict[str, BaseExchange], config: Dict[str, Any]):
     self.cache_duration = 30  # seconds
     
     # Spread tracking for trend analysis
-    self.spread_history: Dict[str, List[Tuple[float, Decimal]]] = {}  # symbol -> [(timestamp, spread)]
     self.spread_history_length = 100
+    self.spread_history: Dict[str, Deque[Tuple[float, Decimal]]] = {}  # symbol -> [(timestamp, spread)]
     
     logger.info("spatial_arbitrage_initialized",
                pairs=len(self.exchange_pairs),
@@ -341,7 +353,7 @@ async def _analyze_exchange_pair(self, symbol: str, buy_exchange: str, sell_exch
 
 def _calculate_max_volume(self, orderbook_levels: List, target_price: Decimal) -> Decimal:
     """Calculate maximum volume available at or better than target price"""
-    max_volume = Decimal('0')
+    max_volume = _ZERO
     
     for level in orderbook_levels:
         # For asks (buying): level price should be <= target price
@@ -370,14 +382,14 @@ async def _get_trading_fee(self, exchange_name: str, symbol: str, is_taker: bool
             return fees.get('taker' if is_taker else 'maker', exchange.taker_fee if is_taker else exchange.maker_fee)
         else:
             # Default fee if exchange not available
-            return Decimal('0.001')  # 0.1%
+            return _DEFAULT_TAKER_FEE
             
     except Exception as e:
         logger.warning("fee_fetch_failed",
                      exchange=exchange_name,
                      symbol=symbol,
                      error=str(e))
-        return Decimal('0.001')  # Default fee
+        return _DEFAULT_TAKER_FEE
 
 def _calculate_confidence_score(self, symbol: str, buy_data: MarketDataPoint, 
                               sell_data: MarketDataPoint, spread_percent: Decimal, 
@@ -427,44 +439,42 @@ def _calculate_risk_score(self, buy_data: MarketDataPoint, sell_data: MarketData
                         spread_percent: Decimal) -> Decimal:
     """Calculate risk score for the opportunity"""
     
-    risk_score = Decimal('0.1')  # Base risk
+    risk_score = _BASE_RISK
     
     # Factor 1: Exchange reliability (would be passed from risk manager)
     # For now, use basic heuristics
     
     # Factor 2: Market volatility
     if spread_percent > 1.0:  # High spread might indicate volatility
-        risk_score += Decimal('0.2')
+        risk_score += _VOLATILITY_RISK
     
     # Factor 3: Order book depth
     min_depth = min(buy_data.bid_depth, sell_data.ask_depth)
     if min_depth < 100:  # Thin books increase risk
-        risk_score += Decimal('0.3')
+        risk_score += _THIN_BOOK_RISK
     
     # Factor 4: Data staleness
     now = time.time()
     max_age = max(now - buy_data.timestamp, now - sell_data.timestamp)
     if max_age > 10:
-        risk_score += Decimal('0.2')
+        risk_score += _STALE_DATA_RISK
     
-    return min(Decimal('1.0'), risk_score)
+    return min(_MAX_RISK, risk_score)
 
 def _update_spread_history(self, symbol: str, spread_percent: Decimal) -> None:
     """Update spread history for trend analysis"""
     now = time.time()
     
-    if symbol not in self.spread_history:
-        self.spread_history[symbol] = []
+    history = self.spread_history.get(symbol)
+    if history is None:
+        history = self.spread_history[symbol] = deque(maxlen=self.spread_history_length)
     
-    history = self.spread_history[symbol]
     history.append((now, spread_percent))
     
-    # Keep only recent history
+    # Keep only recent history; entries are time-ordered, so expire from the left
     cutoff_time = now - 3600  # 1 hour
-    self.spread_history[symbol] = [
-        (ts, spread) for ts, spread in history 
-        if ts > cutoff_time
-    ][-self.spread_history_length:]
+    while history[0][0] <= cutoff_time:
+        history.popleft()
 
 def _get_spread_stability(self, symbol: str) -> float:
     """Get spread stability score (higher = more stable)"""
@@ -472,7 +482,7 @@ def _get_spread_stability(self, symbol: str) -> float:
         return 0.7  # Default moderate stability
     
     history = self.spread_history[symbol]
-    spreads = [float(spread) for _, spread in history[-20:]]  # Last 20 data points
+    spreads = [float(spread) for _, spread in islice(history, max(0, len(history) - 20), None)]  # Last 20 data points
     
     if len(spreads) < 5:
         return 0.7
@@ -508,7 +518,7 @@ def _filter_and_rank_opportunities(self, opportunities: List[SpatialOpportunity]
             filtered.append(opp)
     
     # Sort by expected profit (descending)
-    filtered.sort(key=lambda o: float(o.expected_profit), reverse=True)
+    filtered.sort(key=lambda o: o.expected_profit, reverse=True)
     
     # Limit to top opportunities to avoid overwhelming the system
     return filtered[:10]
@@ -587,26 +597,26 @@ async def _check_balance_sufficiency(self, opportunity: SpatialOpportunity,
         
         # Check buy exchange balance (need quote currency)
         buy_balances = await buy_exchange.get_balance(quote_asset)
-        needed_quote = opportunity.amount * opportunity.buy_price * Decimal('1.01')  # 1% buffer
+        needed_quote = opportunity.amount * opportunity.buy_price * _BALANCE_BUFFER
         
         if quote_asset not in buy_balances or buy_balances[quote_asset].free < needed_quote:
             logger.warning("insufficient_buy_balance", 
                          exchange=opportunity.buy_exchange,
                          asset=quote_asset,
                          needed=float(needed_quote),
-                         available=float(buy_balances.get(quote_asset, Balance(quote_asset, Decimal('0'), Decimal('0'))).free))
+                         available=float(buy_balances.get(quote_asset, Balance(quote_asset, _ZERO, _ZERO)).free))
             return False
         
         # Check sell exchange balance (need base currency)
         sell_balances = await sell_exchange.get_balance(base_asset)
-        needed_base = opportunity.amount * Decimal('1.01')  # 1% buffer
+        needed_base = opportunity.amount * _BALANCE_BUFFER
         
         if base_asset not in sell_balances or sell_balances[base_asset].free < needed_base:
             logger.warning("insufficient_sell_balance",
                          exchange=opportunity.sell_exchange,
                          asset=base_asset,
                          needed=float(needed_base),
-                         available=float(sell_balances.get(base_asset, Balance(base_asset, Decimal('0'), Decimal('0'))).free))
+                         available=float(sell_balances.get(base_asset, Balance(base_asset, _ZERO, _ZERO)).free))
             return False
         
         return True
@@ -624,7 +634,7 @@ async def estimate_profit(self, opportunity: Opportunity) -> Decimal:
         return opportunity.expected_profit
     
     # For other opportunity types, return 0
-    return Decimal('0')
+    return _ZERO
 
 def get_strategy_stats(self) -> Dict[str, Any]:
     """Get strategy performance statistics"""
@@ -0,0 +1,88 @@
+"""
+Async memoization helpers for SmartArb Engine
+"""
+
+import asyncio
+import copy
+import functools
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+
+class _InstanceCache:
+    """One instance's entries: LRU-ordered results and in-flight calls"""
+    __slots__ = ('results', 'pending', '__weakref__')
+
+    def __init__(self):
+        self.results: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.pending: Dict[Hashable, asyncio.Task] = {}
+
+
+def async_ttl(ttl: float, single_flight: bool = True, maxsize: int = 128):
+    """Cache a coroutine method's result per instance and arguments for ttl seconds
+
+    Entries are held per instance through a weak reference, so caching
+    never keeps an instance alive, and each instance keeps at most maxsize
+    results (least recently used dropped first).
+
+    With single_flight, callers arriving while a call for the same arguments
+    is still running await that call instead of starting their own. The call
+    runs as its own task, so cancelling any caller, the first included,
+    leaves the others waiting on it. Errors are shared but never cached.
+    Every caller gets its own deep copy of the result, so one caller
+    editing it cannot change what the others see.
+    The decorated method gains cache_clear(instance).
+    """
+    def decorator(func):
+        caches: 'weakref.WeakKeyDictionary[Any, _InstanceCache]' = weakref.WeakKeyDictionary()
+
+        def store(state: _InstanceCache, key: Hashable, value: Any):
+            state.results[key] = (time.monotonic() + ttl, value)
+            state.results.move_to_end(key)
+            if len(state.results) > maxsize:
+                state.results.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            state = caches.get(self)
+            if state is None:
+                state = caches[self] = _InstanceCache()
+
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = state.results.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                state.results.move_to_end(key)
+                return copy.deepcopy(hit[1])
+
+            if not single_flight:
+                value = await func(self, *args, **kwargs)
+                store(state, key, value)
+                return copy.deepcopy(value)
+
+            task = state.pending.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(self, *args, **kwargs))
+                state.pending[key] = task
+
+                def finished(task, state=state, key=key):
+                    del state.pending[key]
+                    if not task.cancelled() and task.exception() is None:
+                        store(state, key, task.result())
+
+                task.add_done_callback(finished)
+
+            # Shielded so a cancelled caller does not cancel the shared call
+            return copy.deepcopy(await asyncio.shield(task))
+
+        def cache_clear(instance):
+            """Drop instance's cached results; calls in flight are unaffected"""
+            state = caches.get(instance)
+            if state is not None:
+                state.results.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -1,39 +1,293 @@
 """Configuration Manager"""
-import yaml
+import copy
 import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Tuple
+
+import fastjsonschema
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader
+
+# Sections every deployable configuration must define
+REQUIRED_SECTIONS = ('engine', 'logging', 'risk_management', 'exchanges', 'strategies')
+_REQUIRED = frozenset(REQUIRED_SECTIONS)
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Structural rules for a configuration document. The schema never changes,
+# so it is compiled to a validator function once, at import. Section
+# presence is checked separately, before the schema runs
+_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'engine': {'type': 'object'},
+        'logging': {
+            'type': 'object',
+            'properties': {'log_level': {'enum': list(LOG_LEVELS)}},
+        },
+        'risk_management': {'type': 'object'},
+        'exchanges': {'type': 'object', 'additionalProperties': {'type': 'object'}},
+        'strategies': {'type': 'object', 'additionalProperties': {'type': 'object'}},
+    },
+}
+_VALIDATOR = fastjsonschema.compile(_SCHEMA)
+
+# Policy for each credential of an enabled exchange. Breaking it does not
+# make the config invalid (paper trading needs no keys), so it is compiled
+# apart, applied per field and its failures are reported as warnings
+_CREDENTIAL_KEYS = ('api_key', 'api_secret')
+_CREDENTIAL_SCHEMA = {'type': 'string', 'minLength': 1, 'not': {'pattern': '^your_.*_here$'}}
+_CREDENTIAL_VALIDATOR = fastjsonschema.compile(_CREDENTIAL_SCHEMA)
+
+# ${VAR} or ${VAR:default}
+_ENV_RE = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::([^}]*))?\}')
+
+
+def _expand(value: str, env: Mapping[str, str]) -> str:
+    """Expand ${VAR} / ${VAR:default}; the process environment wins over env"""
+    def env_value(match: re.Match) -> str:
+        name = match.group(1)
+        if name in os.environ:
+            return os.environ[name]
+        return env.get(name, match.group(2) or '')
+
+    return _ENV_RE.sub(env_value, value)
+
+
+def _substitute_env(data, env: Mapping[str, str]):
+    """Expand ${VAR} / ${VAR:default} in every string value of data, in place
+
+    Walks with an explicit stack; strings without '${' never reach the regex.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        for key, value in (node.items() if isinstance(node, dict) else enumerate(node)):
+            if isinstance(value, str):
+                if '${' in value:
+                    node[key] = _expand(value, env)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
+
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+# Plain strings in key position, retagged so they skip substitution
+_KEY_TAG = 'tag:smartarb,2024:key'
+
+
+class EnvSubLoader(SafeLoader):
+    """Safe YAML loader that expands ${VAR} / ${VAR:default} while constructing
+
+    Substitution happens as each string value is built, so parsed documents
+    need no second walk. Mapping keys are left as written. Variables are
+    looked up in the process environment, then in the env mapping.
+    """
+    env: Mapping[str, str] = {}
+
+    def construct_mapping(self, node, deep=False):
+        # A substituted key could silently rename or merge config sections
+        for key_node, _ in node.value:
+            if key_node.tag == _STR_TAG:
+                key_node.tag = _KEY_TAG
+        return super().construct_mapping(node, deep=deep)
+
+
+def _construct_str(loader, node):
+    value = loader.construct_scalar(node)
+    return _expand(value, loader.env) if '${' in value else value
+
+
+EnvSubLoader.add_constructor(_STR_TAG, _construct_str)
+EnvSubLoader.add_constructor(_KEY_TAG, SafeLoader.construct_yaml_str)
+
+
+# Parsed .env files by (absolute path, mtime); an edit changes the key
+_ENV_CACHE: Dict[Tuple[str, int], Dict[str, str]] = {}
+
+
+def _load_env_file(path: str) -> Dict[str, str]:
+    """KEY=value pairs of a .env file, quotes stripped; {} if it is missing"""
+    path = os.path.abspath(path)
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return {}
+    entries = _ENV_CACHE.get(key)
+    if entries is None:
+        entries = {}
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if '=' in line and not line.startswith('#'):
+                    k, v = line.split('=', 1)
+                    v = v.strip()
+                    if len(v) >= 2 and v[0] == v[-1] and v[0] in '"\'':
+                        v = v[1:-1]
+                    entries[k.strip()] = v
+        _ENV_CACHE[key] = entries
+    return entries
+
+
+@dataclass
+class ConfigValidationResult:
+    valid: bool = True
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
 
 class ConfigManager:
-    def __init__(self, config_path="config/settings.yaml"):
+    def __init__(self, config_path="config/settings.yaml", source=None):
+        """Load config_path, or parse source (a dict, YAML text or stream) if given"""
         self.config_path = config_path
-        self.config = self.load_env_config()
-    
+        self.env = self.load_env_config()
+        if source is not None:
+            self._config = self._parse_config(source)
+        else:
+            self._config = self._load_config(config_path)
+
+    @classmethod
+    def from_path(cls, path) -> 'ConfigManager':
+        return cls(path)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConfigManager':
+        return cls(None, source=data)
+
+    @classmethod
+    def from_stream(cls, stream) -> 'ConfigManager':
+        """Parse YAML from text or any file-like object, without touching disk"""
+        return cls(None, source=stream)
+
     def load_env_config(self):
-        config = {}
-        if os.path.exists('.env'):
-            with open('.env', 'r') as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        k, v = line.strip().split('=', 1)
-                        config[k] = v
-        return config
-    
+        """Entries of ./.env; used for substitution, never exported to os.environ"""
+        return dict(_load_env_file('.env'))
+
+    def _load_config(self, path) -> Dict[str, Any]:
+        if not os.path.exists(path):
+            return self._get_default_config()
+        with open(path, 'r', encoding='utf-8') as f:
+            return self._parse_config(f)
+
+    def _parse_config(self, source) -> Dict[str, Any]:
+        if isinstance(source, dict):
+            # Substitution works in place; leave the caller's dict untouched
+            return _substitute_env(copy.deepcopy(source), self.env)
+        loader = EnvSubLoader(source)
+        loader.env = self.env
+        try:
+            return loader.get_single_data() or {}
+        finally:
+            loader.dispose()
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Paper-trading configuration used when no config file exists"""
+        return {
+            'engine': {
+                'name': 'SmartArb Engine',
+                'version': '1.0.0',
+                'trading_mode': 'PAPER',
+                'debug_mode': False,
+            },
+            'logging': {
+                'log_level': 'INFO',
+                'log_directory': 'logs',
+            },
+            'risk_management': {
+                'max_daily_loss': 50,
+                'max_position_size': 1000,
+            },
+            'exchanges': {},
+            'strategies': {
+                'spatial_arbitrage': {
+                    'enabled': True,
+                    'min_spread_percent': 0.2,
+                },
+            },
+        }
+
+    def get_config(self) -> Dict[str, Any]:
+        return self._config
+
+    def validate_config(self, fail_fast: bool = False) -> ConfigValidationResult:
+        """Check structure against the schema; credential problems are warnings
+
+        With fail_fast, return at the first error without collecting the rest.
+        """
+        result = ConfigValidationResult()
+        if not isinstance(self._config, dict):
+            result.errors.append('configuration must be a mapping')
+            result.valid = False
+            return result
+
+        missing = _REQUIRED.difference(self._config)
+        if missing:
+            names = ', '.join(s for s in REQUIRED_SECTIONS if s in missing)
+            result.errors.append(f"missing required sections: {names}")
+            if fail_fast:
+                result.valid = False
+                return result
+
+        try:
+            _VALIDATOR(self._config)
+        except fastjsonschema.JsonSchemaValueException as e:
+            result.errors.append(e.message)
+            if fail_fast:
+                result.valid = False
+                return result
+
+        exchanges = self._config.get('exchanges')
+        if isinstance(exchanges, dict):
+            for name, exchange in exchanges.items():
+                if not isinstance(exchange, dict) or exchange.get('enabled') is not True:
+                    continue
+                for key in _CREDENTIAL_KEYS:
+                    value = exchange.get(key)
+                    try:
+                        _CREDENTIAL_VALIDATOR('' if value is None else str(value))
+                    except fastjsonschema.JsonSchemaValueException as e:
+                        problem = 'is a placeholder' if e.rule == 'not' else 'is not set'
+                        result.warnings.append(f"{name}: {key} {problem}")
+
+        result.valid = not result.errors
+        return result
+
+    def update_config(self, section: str, key: str, value: Any) -> bool:
+        """Set section.key in memory; False if section is not a mapping"""
+        target = self._config.setdefault(section, {})
+        if not isinstance(target, dict):
+            return False
+        target[key] = value
+        return True
+
     async def load_all_configs(self):
         pass
-    
+
     def validate_critical_configs(self):
         return True
-    
+
     def get_database_config(self):
-        return {}
-    
-    def get_exchange_config(self):
-        return {}
-    
+        return self._config.get('database', {})
+
+    def get_exchange_config(self, name=None):
+        exchanges = self._config.get('exchanges', {})
+        return exchanges if name is None else exchanges.get(name, {})
+
+    def get_strategy_config(self, name=None):
+        strategies = self._config.get('strategies', {})
+        return strategies if name is None else strategies.get(name, {})
+
     def get_ai_config(self):
-        return {}
-    
+        return self._config.get('ai', {})
+
     def get_monitoring_config(self):
-        return {}
-    
+        return self._config.get('monitoring', {})
+
     def get_notification_config(self):
-        return {}
+        return self._config.get('notifications', {})
@@ -7,15 +7,60 @@ and performance optimization for Raspberry Pi
 
 import sys
 import os
+import atexit
+import queue
+import threading
 import logging
 import logging.handlers
 from pathlib import Path
 from typing import Dict, Any, Optional
 import structlog
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import gzip
 import shutil
+import time
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# Cached ISO timestamp, refreshed at most once per millisecond
+
+_ts_cache = [0, ""]
+
+def _fast_iso() -> str:
+    """Return the current UTC time as ISO-8601, cached at 1 ms resolution"""
+    t = time.time_ns()
+    if t - _ts_cache[0] > 1_000_000:
+        stamp = datetime.fromtimestamp(t / 1e9, timezone.utc)
+        _ts_cache[:] = [t, stamp.isoformat().replace("+00:00", "Z")]
+    return _ts_cache[1]
+
+def _add_timestamp(logger, method_name, event_dict):
+    """structlog processor stamping events with the cached ISO timestamp"""
+    event_dict["timestamp"] = _fast_iso()
+    return event_dict
+
+class LevelCheckedBoundLogger(structlog.stdlib.BoundLogger):
+    """stdlib BoundLogger that drops debug/info calls up front
+
+    The check asks the wrapped stdlib logger, so each logger's own level
+    applies, and a disabled call returns before the event dict or the
+    processor chain is touched.
+    """
+
+    def debug(self, event=None, *args, **kw):
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return None
+        return self._proxy_to_logger("debug", event, *args, **kw)
+
+    def info(self, event=None, *args, **kw):
+        if not self._logger.isEnabledFor(logging.INFO):
+            return None
+        return self._proxy_to_logger("info", event, *args, **kw)
 
 # Configure structlog
 
@@ -25,7 +70,7 @@ structlog.stdlib.filter_by_level,
 structlog.stdlib.add_logger_name,
 structlog.stdlib.add_log_level,
 structlog.stdlib.PositionalArgumentsFormatter(),
-structlog.processors.TimeStamper(fmt=“iso”),
+_add_timestamp,
 structlog.processors.StackInfoRenderer(),
 structlog.processors.format_exc_info,
 structlog.processors.UnicodeDecoder(),
@@ -33,7 +78,7 @@ structlog.processors.JSONRenderer()
 ],
 context_class=dict,
 logger_factory=structlog.stdlib.LoggerFactory(),
-wrapper_class=structlog.stdlib.BoundLogger,
+wrapper_class=LevelCheckedBoundLogger,
 cache_logger_on_first_use=True,
 )
 
@@ -108,6 +153,188 @@ def doRollover(self):
         self.stream = self._open()
 ```
 
+class MsgPackLogFormatter(logging.Formatter):
+    """Encode records as length-prefixed MessagePack frames
+
+    Each frame is a 4-byte little-endian length followed by the packed
+    entry. Use scripts/logcat.py to render a binary log as JSON lines.
+    """
+
+    def format(self, record) -> bytes:
+        log_entry = {
+            'timestamp': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_entry['exception'] = record.exc_text
+        
+        packed = msgpack.packb(log_entry, use_bin_type=True, default=str)
+        return len(packed).to_bytes(4, 'little') + packed
+
+class BinaryRotatingFileHandler(PerformanceOptimizedRotatingFileHandler):
+    """Rotating handler writing pre-encoded binary frames
+
+    Frames are coalesced in memory and written one 4 KiB block at a time,
+    so a burst of small records costs one write() instead of one per
+    record. ERROR records, flush() and close() write the block immediately,
+    and a partial block is written at most flush_interval seconds after its
+    first frame, so a quiet logger does not hold entries back.
+    """
+
+    block_size = 4096
+    flush_interval = 1.0  # seconds
+
+    def __init__(self, filename, maxBytes=0, backupCount=0):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=True)
+        # RotatingFileHandler forces text append mode when maxBytes is set
+        self.mode = 'ab'
+        self.encoding = None
+        self.setFormatter(MsgPackLogFormatter())
+        self._block = bytearray()
+        self._flush_timer = None
+
+    def emit(self, record):
+        try:
+            self._block += self.format(record)
+            if len(self._block) >= self.block_size or record.levelno >= logging.ERROR:
+                self._write_block()
+            elif self._flush_timer is None:
+                # One timer per block, started by its first frame
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def _write_block(self):
+        """Write the pending block, rotating first if it would overflow"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._block:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        pos = self.stream.tell()
+        if self.maxBytes > 0 and pos and pos + len(self._block) >= self.maxBytes:
+            self.doRollover()
+            self.stream = self._open()
+        self.stream.write(self._block)
+        self.stream.flush()
+        self._block.clear()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_block()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+class RoutedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that tags each record with its destination logger"""
+
+    def __init__(self, log_queue, route: str):
+        super().__init__(log_queue)
+        self.route = route
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+class LogRouterHandler(logging.Handler):
+    """Dispatch queued records to the file/console handlers of their logger
+
+    Runs on the QueueListener thread, so disk and console writes never
+    happen on the thread that emitted the log record. Text log files are
+    written without a per-record flush; flush_pending() pushes every file
+    touched by a batch to disk with one write per file.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, list] = {}
+        self._pending = set()
+
+    def add_route(self, name: str, handlers: list):
+        self.routes[name] = handlers
+
+    def handle(self, record):
+        for handler in self.routes.get(getattr(record, 'log_route', record.name), ()):
+            if record.levelno < handler.level:
+                continue
+            if (isinstance(handler, logging.handlers.RotatingFileHandler)
+                    and not isinstance(handler, BinaryRotatingFileHandler)):
+                self._write_deferred(handler, record)
+            else:
+                handler.handle(record)
+        return True
+
+    def _write_deferred(self, handler, record):
+        """RotatingFileHandler.emit without the trailing flush"""
+        handler.acquire()
+        try:
+            if handler.shouldRollover(record):
+                handler.doRollover()
+            if handler.stream is None:
+                handler.stream = handler._open()
+            handler.stream.write(handler.format(record) + handler.terminator)
+            self._pending.add(handler)
+        except Exception:
+            handler.handleError(record)
+        finally:
+            handler.release()
+
+    def flush_pending(self):
+        """Flush every file written since the last call"""
+        for handler in self._pending:
+            handler.flush()
+        self._pending.clear()
+
+    def close(self):
+        self.flush_pending()
+        for handlers in self.routes.values():
+            for handler in handlers:
+                handler.close()
+        super().close()
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains records in batches
+
+    Everything already queued (up to max_batch) is handled before the
+    router flushes, so a burst across several loggers costs one write
+    per log file rather than one per record.
+    """
+
+    max_batch = 256
+
+    def _monitor(self):
+        while True:
+            batch = [self.dequeue(True)]
+            while batch[-1] is not self._sentinel and len(batch) < self.max_batch:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            
+            for record in batch:
+                if record is not self._sentinel:
+                    self.handle(record)
+            for handler in self.handlers:
+                if isinstance(handler, LogRouterHandler):
+                    handler.flush_pending()
+            
+            if batch[-1] is self._sentinel:
+                break
+
 class SmartArbLoggingManager:
 “”“Centralized logging management”””
 
@@ -119,13 +346,28 @@ def __init__(self, config: Dict[str, Any]):
     self.log_level = self.logging_config.get('log_level', 'INFO')
     self.max_file_size = self.logging_config.get('max_file_size_mb', 50) * 1024 * 1024
     self.backup_count = self.logging_config.get('backup_count', 10)
+    self.async_logging = self.logging_config.get('async_logging', True)
+    
+    # Opt-in MessagePack output for the high-volume trading/performance logs
+    self.binary_logs = self.logging_config.get('binary_logs', False) and HAS_MSGPACK
     
     # Create log directory
     self.log_dir.mkdir(exist_ok=True)
     
+    # Background writer: loggers only enqueue records, a single listener
+    # thread performs all file and console I/O
+    self._log_queue = queue.SimpleQueue()
+    self._router = LogRouterHandler()
+    self._listener = None
+    
     # Specialized loggers
     self.loggers = {}
     self._setup_loggers()
+    
+    if self.async_logging:
+        self._listener = BatchingQueueListener(self._log_queue, self._router)
+        self._listener.start()
+    atexit.register(self.shutdown)
 
 def _setup_loggers(self):
     """Setup specialized loggers for different components"""
@@ -149,7 +391,8 @@ def _setup_loggers(self):
     self._setup_logger(
         'smartarb.trading',
         self.log_dir / 'trading.log',
-        logging.INFO
+        logging.INFO,
+        binary=self.binary_logs
     )
     
     # Risk management logger
@@ -170,7 +413,8 @@ def _setup_loggers(self):
     self._setup_logger(
         'smartarb.performance',
         self.log_dir / 'performance.log',
-        logging.INFO
+        logging.INFO,
+        binary=self.binary_logs
     )
     
     # Error logger
@@ -180,32 +424,57 @@ def _setup_loggers(self):
         logging.ERROR
     )
 
-def _setup_logger(self, name: str, file_path: Path, level: int):
+def _setup_logger(self, name: str, file_path: Path, level: int, binary: bool = False):
     """Setup individual logger"""
     logger = logging.getLogger(name)
     logger.setLevel(level)
     logger.handlers.clear()
     
     # File handler with rotation
-    file_handler = PerformanceOptimizedRotatingFileHandler(
-        filename=file_path,
-        maxBytes=self.max_file_size,
-        backupCount=self.backup_count
-    )
-    file_handler.setFormatter(SmartArbFormatter())
-    logger.addHandler(file_handler)
+    if binary:
+        file_handler = BinaryRotatingFileHandler(
+            filename=file_path.with_suffix('.bin'),
+            maxBytes=self.max_file_size,
+            backupCount=self.backup_count
+        )
+    else:
+        file_handler = PerformanceOptimizedRotatingFileHandler(
+            filename=file_path,
+            maxBytes=self.max_file_size,
+            backupCount=self.backup_count
+        )
+        file_handler.setFormatter(SmartArbFormatter())
+    handlers = [file_handler]
     
     # Console handler for important logs
     if level >= logging.WARNING or name == 'smartarb.main':
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(SmartArbFormatter())
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    if self.async_logging:
+        self._router.add_route(name, handlers)
+        logger.addHandler(RoutedQueueHandler(self._log_queue, name))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
     
     self.loggers[name] = logger
 
 def get_logger(self, name: str) -> logging.Logger:
     """Get specialized logger"""
     return self.loggers.get(name, logging.getLogger(name))
+
+def shutdown(self):
+    """Flush queued records and buffered blocks, stop the background log writer"""
+    if self._listener:
+        self._listener.stop()
+        self._listener = None
+        self._router.close()
+    else:
+        for logger in self.loggers.values():
+            for handler in logger.handlers:
+                handler.flush()
 ```
 
 def setup_logging(config: Dict[str, Any]) -> SmartArbLoggingManager:
@@ -230,13 +499,23 @@ def get_specialized_loggers(logging_manager: SmartArbLoggingManager) -> Dict[str
 “”“Get all specialized loggers”””
 return logging_manager.loggers
 
+# Bound structlog loggers shared by every instance of a class
+_class_loggers: Dict[str, Any] = {}
+
+def get_class_logger(name: str):
+    """Return the shared structlog logger for name, creating it once"""
+    logger = _class_loggers.get(name)
+    if logger is None:
+        logger = _class_loggers[name] = structlog.get_logger(name)
+    return logger
+
 class LoggingMixin:
 “”“Mixin class to add logging capabilities to any class”””
 
 ```
 def __init__(self, *args, **kwargs):
     super().__init__(*args, **kwargs)
-    self.logger = structlog.get_logger(self.__class__.__name__.lower())
+    self.logger = get_class_logger(self.__class__.__name__.lower())
 
 def log_info(self, message: str, **kwargs):
     """Log info message"""
@@ -258,13 +537,13 @@ def log_debug(self, message: str, **kwargs):
 def performance_logger(func):
 “”“Decorator to log function performance”””
 def wrapper(*args, **kwargs):
-start_time = datetime.now()
+start_time = time.perf_counter_ns()
 logger = structlog.get_logger(func.**module**)
 
 ```
     try:
         result = func(*args, **kwargs)
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
         
         logger.info(
             "function_executed",
@@ -276,7 +555,7 @@ logger = structlog.get_logger(func.**module**)
         return result
         
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
         
         logger.error(
             "function_failed",
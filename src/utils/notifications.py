@@ -4,21 +4,47 @@ Supports multiple notification channels: Telegram, Email, Webhooks, Discord
 “””
 
 import asyncio
+import inspect
+import logging
 import aiohttp
 import smtplib
 import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import structlog
 import json
+import html
+import hashlib
+from string import Template
+from collections import Counter, OrderedDict, defaultdict, deque
 from datetime import datetime, timedelta
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import aiosmtplib
+    HAS_AIOSMTPLIB = True
+except ImportError:
+    HAS_AIOSMTPLIB = False
+
 logger = structlog.get_logger(**name**)
 
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
 class NotificationLevel(Enum):
 “”“Notification priority levels”””
 INFO = “info”
@@ -35,7 +61,7 @@ WEBHOOK = “webhook”
 DISCORD = “discord”
 CONSOLE = “console”
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
 “”“Notification message structure”””
 title: str
@@ -46,6 +72,10 @@ timestamp: datetime
 data: Optional[Dict[str, Any]] = None
 retry_count: int = 0
 max_retries: int = 3
+# Rendered request bodies, filled by the notifier on first send and reused on retry
+_telegram_data: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+_discord_body: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+_webhook_body: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
 ```
 def __post_init__(self):
@@ -53,6 +83,35 @@ def __post_init__(self):
         self.timestamp = datetime.now()
 ```
 
+# Concurrent in-flight sends allowed per channel, to stay within provider limits
+CHANNEL_CONCURRENCY = {
+    NotificationChannel.TELEGRAM: 5,
+    NotificationChannel.DISCORD: 5,
+    NotificationChannel.WEBHOOK: 10,
+    NotificationChannel.EMAIL: 1,
+    NotificationChannel.CONSOLE: 1,
+}
+
+# Longest text each provider accepts in the field carrying the message
+CHANNEL_MAX_MESSAGE_LENGTH = {
+    NotificationChannel.TELEGRAM: 4096,
+    NotificationChannel.DISCORD: 1900,
+    NotificationChannel.WEBHOOK: 16000,
+}
+
+# Channels that render title and message into that one field, with the
+# characters their formatting adds: for Telegram the emoji (up to two),
+# ' *', '*' and the blank line. Other channels send the title separately
+CHANNEL_TITLE_OVERHEAD = {
+    NotificationChannel.TELEGRAM: 7,
+}
+
+def _truncate(text: str, max_length: int) -> str:
+    """text cut to max_length characters, ending in an ellipsis if cut"""
+    if len(text) <= max_length:
+        return text
+    return text[:max(max_length - 1, 0)] + '…'
+
 class NotificationManager:
 “””
 Centralized notification management system
@@ -83,18 +142,35 @@ def __init__(self, config: Dict[str, Any]):
         NotificationLevel.CRITICAL: 0,   # No limit
         NotificationLevel.SUCCESS: 60    # Max 1 per minute
     }
+    self.rate_limit_burst = 5  # Notifications allowed back-to-back after idle
     
-    # Track last notification times for rate limiting
-    self.last_notification_times = {}
-    
-    # Queue for batch processing
-    self.notification_queue = asyncio.Queue()
+    # Token buckets kept as integer nanoseconds (GCRA): per level the
+    # (emission interval, burst tolerance) and the theoretical arrival time
+    self._rate_limit_ns: Dict[NotificationLevel, Tuple[int, int]] = {
+        level: (int(interval * 1e9), int(interval * 1e9) * (self.rate_limit_burst - 1))
+        for level, interval in self.rate_limits.items() if interval > 0
+    }
+    self._tat_ns: Dict[NotificationLevel, int] = {}
+    
+    # Duplicate suppression: payload hash -> monotonic_ns last queued
+    self._dedup: OrderedDict[str, int] = OrderedDict()
+    self._dedup_ttl_ns = int(self.notification_config.get('dedup_ttl', 300) * 1e9)
+    self._dedup_max = 1024
+    
+    # Per-channel circuit breaker: (consecutive failures, open until monotonic_ns)
+    self._breaker: Dict[NotificationChannel, Tuple[int, int]] = {}
+    self.breaker_threshold = self.notification_config.get('breaker_threshold', 5)
+    self._breaker_cooldown_ns = int(self.notification_config.get('breaker_cooldown', 60) * 1e9)
+    
+    # Pending notifications for batch processing; the event wakes the
+    # processor once per burst rather than once per item
+    self._pending: List[Notification] = []
+    self._pending_event = asyncio.Event()
     self.batch_size = 10
-    self.batch_timeout = 30  # seconds
     
-    # Notification history
-    self.notification_history = []
+    # Notification history (oldest entries drop off automatically)
     self.max_history_size = 1000
+    self.notification_history = deque(maxlen=self.max_history_size)
     
     # Statistics
     self.stats = {
@@ -107,10 +183,21 @@ def __init__(self, config: Dict[str, Any]):
     # Start background processor
     self.processor_task = None
     
+    # Shared HTTP session for all HTTP-based channels (opened in start())
+    self._session: Optional[aiohttp.ClientSession] = None
+    
     logger.info("notification_manager_initialized",
                channels=list(self.channels.keys()),
                rate_limits=self.rate_limits)
 
+@property
+def _log_debug_enabled(self) -> bool:
+    """Whether dropped notifications are worth a debug line"""
+    # This module's logger, not the root: its level is the one that
+    # filters the debug lines. Read on every use, so a level changed at
+    # runtime takes effect; isEnabledFor() is cached per level
+    return logging.getLogger(**name**).isEnabledFor(logging.DEBUG)
+
 def _initialize_channels(self):
     """Initialize notification channels based on configuration"""
     
@@ -140,9 +227,33 @@ def _initialize_channels(self):
     
     # Console (always enabled)
     self.channels[NotificationChannel.CONSOLE] = ConsoleNotifier()
+    
+    # Resolve each channel's send callable and whether it must be awaited once,
+    # so dispatch does no per-notification introspection
+    self._senders = {
+        channel: (handler.send, inspect.iscoroutinefunction(handler.send))
+        for channel, handler in self.channels.items()
+    }
+    self._semaphores = {
+        channel: asyncio.Semaphore(CHANNEL_CONCURRENCY.get(channel, 1))
+        for channel in self.channels
+    }
+    
+    # Channel set is fixed after setup; notify() defaults to this tuple
+    self._all_channels = tuple(self.channels)
 
 async def start(self):
     """Start the notification processor"""
+    if self._session is None:
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200, limit_per_host=32,
+                                           ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        for handler in self.channels.values():
+            if isinstance(handler, HTTPSessionMixin):
+                handler.session = self._session
+    
     if not self.processor_task:
         self.processor_task = asyncio.create_task(self._process_notifications())
         logger.info("notification_processor_started")
@@ -156,6 +267,19 @@ async def stop(self):
         except asyncio.CancelledError:
             pass
         logger.info("notification_processor_stopped")
+    
+    await self.close()
+
+async def close(self):
+    """Close channel connections and the shared HTTP session"""
+    for handler in self.channels.values():
+        close = getattr(handler, 'close', None)
+        if close is not None:
+            await close()
+    
+    if self._session is not None:
+        await self._session.close()
+        self._session = None
 
 async def notify(self, title: str, message: str, 
                 level: NotificationLevel = NotificationLevel.INFO,
@@ -165,74 +289,110 @@ async def notify(self, title: str, message: str,
     
     # Default to all configured channels if none specified
     if channels is None:
-        channels = list(self.channels.keys())
+        channels = self._all_channels
+    else:
+        channels = [channel for channel in channels if channel in self.channels]
+        if not channels:
+            # Nothing to deliver to; leave rate-limit state untouched
+            return
+    
+    # Drop channels that already got this exact notification within the TTL
+    now = time.monotonic_ns()
+    fresh = []
+    for channel in channels:
+        key = hashlib.md5(
+            f"{title}|{message}|{level.value}|{channel.value}".encode()
+        ).hexdigest()
+        sent_at = self._dedup.get(key)
+        if sent_at is None or now - sent_at >= self._dedup_ttl_ns:
+            fresh.append((channel, key))
+    
+    if not fresh:
+        if self._log_debug_enabled:
+            logger.debug("notification_duplicate_suppressed", title=title)
+        return
     
     # Apply rate limiting
-    if not self._check_rate_limit(level):
-        logger.debug("notification_rate_limited", level=level.value)
+    if not self._check_rate_limit(level, now):
+        if self._log_debug_enabled:
+            logger.debug("notification_rate_limited", level=level.value)
         return
     
-    # Create notifications for each channel
-    for channel in channels:
-        if channel in self.channels:
-            notification = Notification(
-                title=title,
-                message=message,
-                level=level,
-                channel=channel,
-                timestamp=datetime.now(),
-                data=data
-            )
-            
-            await self.notification_queue.put(notification)
-    
-    # Update rate limiting
-    self._update_rate_limit(level)
-
-def _check_rate_limit(self, level: NotificationLevel) -> bool:
-    """Check if notification is within rate limits"""
+    # One wall-clock timestamp shared by every channel's copy
+    timestamp = datetime.now()
     
-    rate_limit = self.rate_limits.get(level, 0)
-    if rate_limit == 0:  # No limit
+    # Create notifications for each channel
+    for channel, key in fresh:
+        self._remember_sent(key, now)
+        
+        # Truncate once here rather than have the provider reject the send
+        # and trigger a retry storm
+        channel_title, channel_message = title, message
+        max_length = CHANNEL_MAX_MESSAGE_LENGTH.get(channel)
+        if max_length is not None:
+            overhead = CHANNEL_TITLE_OVERHEAD.get(channel)
+            if overhead is not None:
+                # Title and body share the limit; the title gets at most half
+                channel_title = _truncate(title, max_length // 2)
+                max_length -= overhead + len(channel_title)
+            channel_message = _truncate(message, max_length)
+        
+        notification = Notification(
+            title=channel_title,
+            message=channel_message,
+            level=level,
+            channel=channel,
+            timestamp=timestamp,
+            data=data
+        )
+        
+        self._enqueue(notification)
+
+def _enqueue(self, notification: Notification):
+    """Hand a notification to the background processor"""
+    self._pending.append(notification)
+    self._pending_event.set()
+
+def _remember_sent(self, key: str, now: int):
+    """Record a payload hash in the bounded dedup cache"""
+    self._dedup[key] = now
+    self._dedup.move_to_end(key)
+    while len(self._dedup) > self._dedup_max:
+        self._dedup.popitem(last=False)
+
+def _check_rate_limit(self, level: NotificationLevel,
+                      now: Optional[int] = None) -> bool:
+    """Take a token from the level's bucket; False if the bucket is empty"""
+    
+    params = self._rate_limit_ns.get(level)
+    if params is None:  # No limit
         return True
     
-    last_time = self.last_notification_times.get(level)
-    if last_time is None:
-        return True
+    interval, tolerance = params
+    if now is None:
+        now = time.monotonic_ns()
+    tat = self._tat_ns.get(level, now)
+    if tat < now:
+        tat = now
     
-    time_since_last = (datetime.now() - last_time).total_seconds()
-    return time_since_last >= rate_limit
+    if tat - now > tolerance:
+        return False
 
-def _update_rate_limit(self, level: NotificationLevel):
-    """Update last notification time for rate limiting"""
-    self.last_notification_times[level] = datetime.now()
+    self._tat_ns[level] = tat + interval
+    return True
 
 async def _process_notifications(self):
     """Background processor for notifications"""
     
     while True:
         try:
-            batch = []
-            
-            # Collect batch of notifications
-            try:
-                # Get first notification with timeout
-                notification = await asyncio.wait_for(
-                    self.notification_queue.get(),
-                    timeout=self.batch_timeout
-                )
-                batch.append(notification)
-                
-                # Collect additional notifications up to batch size
-                while len(batch) < self.batch_size:
-                    try:
-                        notification = self.notification_queue.get_nowait()
-                        batch.append(notification)
-                    except asyncio.QueueEmpty:
-                        break
+            await self._pending_event.wait()
             
-            except asyncio.TimeoutError:
-                continue  # No notifications to process
+            # Take up to batch_size pending notifications in one go
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            if not self._pending:
+                self._pending_event.clear()
             
             # Process batch
             if batch:
@@ -248,12 +408,9 @@ async def _process_batch(self, notifications: List[Notification]):
     """Process a batch of notifications"""
     
     # Group by channel for efficient processing
-    by_channel = {}
+    by_channel = defaultdict(list)
     for notification in notifications:
-        channel = notification.channel
-        if channel not in by_channel:
-            by_channel[channel] = []
-        by_channel[channel].append(notification)
+        by_channel[notification.channel].append(notification)
     
     # Send notifications for each channel
     tasks = []
@@ -271,42 +428,81 @@ async def _send_channel_notifications(self, channel: NotificationChannel,
                                     notifications: List[Notification]):
     """Send notifications for a specific channel"""
     
-    channel_handler = self.channels[channel]
+    # While the channel's breaker is open, hold the batch until the cooldown
+    # ends instead of sending into an outage; this does not use up retries
+    fail_count, open_until = self._breaker.get(channel, (0, 0))
+    now = time.monotonic_ns()
+    if open_until > now:
+        loop = asyncio.get_running_loop()
+        delay = (open_until - now) / 1e9
+        for notification in notifications:
+            loop.call_later(delay, self._enqueue, notification)
+        return
     
-    for notification in notifications:
-        try:
-            success = await channel_handler.send(notification)
-            
-            if success:
-                self._update_stats(notification, True)
-                self.notification_history.append(notification)
-            else:
-                self._update_stats(notification, False)
-                await self._handle_failed_notification(notification)
-            
-        except Exception as e:
+    send, is_async = self._senders[channel]
+    
+    if is_async:
+        # Dispatch concurrently so a batch costs ~1 round-trip, bounded by the
+        # channel's semaphore
+        semaphore = self._semaphores[channel]
+        
+        async def _send(notification: Notification) -> bool:
+            async with semaphore:
+                return await send(notification)
+        
+        results = await asyncio.gather(*(_send(n) for n in notifications),
+                                       return_exceptions=True)
+    else:
+        results = []
+        for notification in notifications:
+            try:
+                results.append(send(notification))
+            except Exception as e:
+                results.append(e)
+    
+    sent_by_level = Counter()
+    failed_by_level = Counter()
+    
+    for notification, result in zip(notifications, results):
+        level_name = notification.level.value
+        sent_by_level[level_name] += 1
+        
+        if isinstance(result, BaseException):
             logger.error("notification_send_error",
                        channel=channel.value,
-                       error=str(e))
-            self._update_stats(notification, False)
-            await self._handle_failed_notification(notification)
-    
-    # Limit history size
-    if len(self.notification_history) > self.max_history_size:
-        self.notification_history = self.notification_history[-self.max_history_size:]
+                       error=str(result))
+            failed_by_level[level_name] += 1
+            fail_count += 1
+            self._handle_failed_notification(notification)
+        elif result:
+            self.notification_history.append(notification)
+            fail_count = 0
+        else:
+            failed_by_level[level_name] += 1
+            fail_count += 1
+            self._handle_failed_notification(notification)
+    
+    self._update_stats(channel, sent_by_level, failed_by_level)
+    
+    if fail_count >= self.breaker_threshold:
+        self._breaker[channel] = (0, time.monotonic_ns() + self._breaker_cooldown_ns)
+        logger.warning("notification_channel_circuit_open",
+                      channel=channel.value,
+                      cooldown=self._breaker_cooldown_ns / 1e9)
+    else:
+        self._breaker[channel] = (fail_count, 0)
 
-async def _handle_failed_notification(self, notification: Notification):
+def _handle_failed_notification(self, notification: Notification):
     """Handle failed notification with retry logic"""
     
     notification.retry_count += 1
     
     if notification.retry_count <= notification.max_retries:
-        # Exponential backoff
+        # Exponential backoff, scheduled so the channel loop is not held up
         delay = 2 ** notification.retry_count
-        await asyncio.sleep(delay)
         
         # Re-queue for retry
-        await self.notification_queue.put(notification)
+        asyncio.get_running_loop().call_later(delay, self._enqueue, notification)
         
         logger.info("notification_retry_queued",
                    title=notification.title,
@@ -317,31 +513,27 @@ async def _handle_failed_notification(self, notification: Notification):
                     title=notification.title,
                     retries=notification.retry_count)
 
-def _update_stats(self, notification: Notification, success: bool):
-    """Update notification statistics"""
+def _update_stats(self, channel: NotificationChannel,
+                  sent_by_level: Counter, failed_by_level: Counter):
+    """Update notification statistics once for a channel's whole batch"""
     
-    self.stats['total_sent'] += 1
+    sent = sum(sent_by_level.values())
+    failed = sum(failed_by_level.values())
     
-    if not success:
-        self.stats['failed_sends'] += 1
+    self.stats['total_sent'] += sent
+    self.stats['failed_sends'] += failed
     
     # Update channel stats
-    channel_name = notification.channel.value
-    if channel_name not in self.stats['by_channel']:
-        self.stats['by_channel'][channel_name] = {'sent': 0, 'failed': 0}
-    
-    self.stats['by_channel'][channel_name]['sent'] += 1
-    if not success:
-        self.stats['by_channel'][channel_name]['failed'] += 1
+    channel_stats = self.stats['by_channel'].setdefault(channel.value, {'sent': 0, 'failed': 0})
+    channel_stats['sent'] += sent
+    channel_stats['failed'] += failed
     
     # Update level stats
-    level_name = notification.level.value
-    if level_name not in self.stats['by_level']:
-        self.stats['by_level'][level_name] = {'sent': 0, 'failed': 0}
-    
-    self.stats['by_level'][level_name]['sent'] += 1
-    if not success:
-        self.stats['by_level'][level_name]['failed'] += 1
+    by_level = self.stats['by_level']
+    for level_name, count in sent_by_level.items():
+        level_stats = by_level.setdefault(level_name, {'sent': 0, 'failed': 0})
+        level_stats['sent'] += count
+        level_stats['failed'] += failed_by_level[level_name]
 
 # Convenience methods for different notification levels
 async def info(self, title: str, message: str, **kwargs):
@@ -415,46 +607,144 @@ def get_stats(self) -> Dict[str, Any]:
     return self.stats.copy()
 ```
 
-class TelegramNotifier:
+class HTTPSessionMixin:
+    """Pooled aiohttp session for HTTP-based notifiers
+
+    NotificationManager assigns one session shared by all HTTP channels on
+    start(); callers can also pass a session to the constructor. A notifier
+    without one lazily opens a private keep-alive session instead, so no
+    send ever pays for a fresh connection pool.
+    """
+
+    session: Optional[aiohttp.ClientSession] = None
+    _owns_session = False
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._owns_session = True
+        return self.session
+
+    async def close(self):
+        """Release the session, closing it only if this notifier opened it"""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+        self.session = None
+        self._owns_session = False
+
+# Telegram message emoji per level
+TELEGRAM_LEVEL_EMOJIS = {
+    NotificationLevel.INFO: "ℹ️",
+    NotificationLevel.WARNING: "⚠️",
+    NotificationLevel.ERROR: "❌",
+    NotificationLevel.CRITICAL: "🚨",
+    NotificationLevel.SUCCESS: "✅"
+}
+
+# Characters Telegram's legacy Markdown parser treats as markup
+TELEGRAM_MARKDOWN_CHARS = frozenset('_*`[')
+
+class TelegramNotifier(HTTPSessionMixin):
 “”“Telegram bot notifier”””
 
 ```
-def __init__(self, config: Dict[str, Any]):
+def __init__(self, config: Dict[str, Any], session: Optional[aiohttp.ClientSession] = None):
     self.bot_token = config.get('bot_token')
     self.chat_id = config.get('chat_id')
     self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
+    self.session = session
     
     # Emoji mapping for different levels
-    self.level_emojis = {
-        NotificationLevel.INFO: "ℹ️",
-        NotificationLevel.WARNING: "⚠️",
-        NotificationLevel.ERROR: "❌",
-        NotificationLevel.CRITICAL: "🚨",
-        NotificationLevel.SUCCESS: "✅"
+    self.level_emojis = TELEGRAM_LEVEL_EMOJIS
+    
+    # Per-level message builders with the emoji baked in
+    self._formatters = {
+        level: self._make_formatter(emoji)
+        for level, emoji in self.level_emojis.items()
+    }
+    self._default_formatter = self._make_formatter("📢")
+    self._plain_formatters = {
+        level: self._make_plain_formatter(emoji)
+        for level, emoji in self.level_emojis.items()
     }
+    self._default_plain_formatter = self._make_plain_formatter("📢")
+
+@staticmethod
+def _make_formatter(emoji: str):
+    """Build a (title, message) -> text formatter for one level"""
+    return lambda title, message: f"{emoji} *{title}*\n\n{message}"
+
+@staticmethod
+def _make_plain_formatter(emoji: str):
+    """Build a formatter for text that must not go through the Markdown parser"""
+    return lambda title, message: f"{emoji} {title}\n\n{message}"
 
 async def send(self, notification: Notification) -> bool:
     """Send Telegram notification"""
     
     try:
-        emoji = self.level_emojis.get(notification.level, "📢")
-        text = f"{emoji} *{notification.title}*\n\n{notification.message}"
+        data = notification._telegram_data
+        if data is None:
+            title, message = notification.title, notification.message
+            if (TELEGRAM_MARKDOWN_CHARS.isdisjoint(title)
+                    and TELEGRAM_MARKDOWN_CHARS.isdisjoint(message)):
+                formatter = self._formatters.get(notification.level, self._default_formatter)
+                data = {
+                    'chat_id': self.chat_id,
+                    'text': formatter(title, message),
+                    'parse_mode': 'Markdown'
+                }
+            else:
+                # Stray markup characters would make Telegram reject the
+                # message; send it as plain text instead of escaping
+                formatter = self._plain_formatters.get(notification.level,
+                                                       self._default_plain_formatter)
+                data = {
+                    'chat_id': self.chat_id,
+                    'text': formatter(title, message)
+                }
+            notification._telegram_data = data
         
-        async with aiohttp.ClientSession() as session:
-            data = {
-                'chat_id': self.chat_id,
-                'text': text,
-                'parse_mode': 'Markdown'
-            }
-            
-            async with session.post(f"{self.base_url}/sendMessage", data=data) as response:
-                return response.status == 200
+        async with self._get_session().post(f"{self.base_url}/sendMessage", data=data) as response:
+            return response.status == 200
                 
     except Exception as e:
         logger.error("telegram_send_error", error=str(e))
         return False
 ```
 
+# Email header colors per level
+EMAIL_LEVEL_COLORS = {
+    NotificationLevel.INFO: "#17a2b8",
+    NotificationLevel.WARNING: "#ffc107",
+    NotificationLevel.ERROR: "#dc3545",
+    NotificationLevel.CRITICAL: "#721c24",
+    NotificationLevel.SUCCESS: "#28a745"
+}
+
+EMAIL_HTML_TEMPLATE = Template("""
+    <html>
+    <head></head>
+    <body>
+        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <div style="background-color: $color; color: white; padding: 20px; text-align: center;">
+                <h2 style="margin: 0;">$title</h2>
+                <p style="margin: 5px 0 0 0;">SmartArb Engine - $timestamp</p>
+            </div>
+            <div style="padding: 20px; background-color: #f8f9fa;">
+                <pre style="white-space: pre-wrap; font-family: Arial, sans-serif;">$message</pre>
+            </div>
+            <div style="padding: 10px; background-color: #e9ecef; text-align: center; font-size: 12px; color: #6c757d;">
+                This is an automated message from SmartArb Engine
+            </div>
+        </div>
+    </body>
+    </html>
+    """)
+
 class EmailNotifier:
 “”“Email notifier using SMTP”””
 
@@ -468,6 +758,13 @@ def __init__(self, config: Dict[str, Any]):
     self.to_emails = config.get('to_emails', [])
     if isinstance(self.to_emails, str):
         self.to_emails = [self.to_emails]
+    
+    # Persistent SMTP connection (aiosmtplib only), reopened on demand
+    self._smtp = None
+    self._smtp_lock = asyncio.Lock()
+    
+    # Dedicated worker threads for the blocking smtplib fallback
+    self._executor: Optional[ThreadPoolExecutor] = None
 
 async def send(self, notification: Notification) -> bool:
     """Send email notification"""
@@ -483,13 +780,13 @@ async def send(self, notification: Notification) -> bool:
         body = self._create_html_body(notification)
         msg.attach(MIMEText(body, 'html'))
         
-        # Send email
-        context = ssl.create_default_context()
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls(context=context)
-            server.login(self.username, self.password)
-            text = msg.as_string()
-            server.sendmail(self.from_email, self.to_emails, text)
+        if HAS_AIOSMTPLIB:
+            await self._send_async(msg)
+        else:
+            # Send email off the event loop; smtplib blocks for the whole round-trip
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='smtp')
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._send_sync, msg)
         
         return True
         
@@ -497,137 +794,164 @@ async def send(self, notification: Notification) -> bool:
         logger.error("email_send_error", error=str(e))
         return False
 
+async def _send_async(self, msg: MIMEMultipart):
+    """Deliver a message over the persistent connection, reconnecting once if it dropped"""
+    async with self._smtp_lock:
+        if self._smtp is None or not self._smtp.is_connected:
+            await self._connect()
+        try:
+            await self._smtp.send_message(msg, sender=self.from_email, recipients=self.to_emails)
+        except aiosmtplib.SMTPServerDisconnected:
+            await self._connect()
+            await self._smtp.send_message(msg, sender=self.from_email, recipients=self.to_emails)
+
+async def _connect(self):
+    """Open the SMTP connection: connect, STARTTLS and log in"""
+    self._smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=False)
+    await self._smtp.connect()
+    await self._smtp.starttls(tls_context=ssl.create_default_context())
+    await self._smtp.login(self.username, self.password)
+
+async def close(self):
+    """Close the persistent SMTP connection and the worker threads"""
+    if self._smtp is not None and self._smtp.is_connected:
+        try:
+            await self._smtp.quit()
+        except Exception as e:
+            logger.warning("email_close_error", error=str(e))
+    self._smtp = None
+    
+    if self._executor is not None:
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+def _send_sync(self, msg: MIMEMultipart):
+    """Deliver a message over SMTP (blocking, runs in a worker thread)"""
+    context = ssl.create_default_context()
+    with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+        server.starttls(context=context)
+        server.login(self.username, self.password)
+        server.sendmail(self.from_email, self.to_emails, msg.as_string())
+
 def _create_html_body(self, notification: Notification) -> str:
     """Create HTML email body"""
-    
-    level_colors = {
-        NotificationLevel.INFO: "#17a2b8",
-        NotificationLevel.WARNING: "#ffc107",
-        NotificationLevel.ERROR: "#dc3545",
-        NotificationLevel.CRITICAL: "#721c24",
-        NotificationLevel.SUCCESS: "#28a745"
-    }
-    
-    color = level_colors.get(notification.level, "#6c757d")
-    
-    html = f"""
-    <html>
-    <head></head>
-    <body>
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background-color: {color}; color: white; padding: 20px; text-align: center;">
-                <h2 style="margin: 0;">{notification.title}</h2>
-                <p style="margin: 5px 0 0 0;">SmartArb Engine - {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            <div style="padding: 20px; background-color: #f8f9fa;">
-                <pre style="white-space: pre-wrap; font-family: Arial, sans-serif;">{notification.message}</pre>
-            </div>
-            <div style="padding: 10px; background-color: #e9ecef; text-align: center; font-size: 12px; color: #6c757d;">
-                This is an automated message from SmartArb Engine
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    return html
+    return EMAIL_HTML_TEMPLATE.substitute(
+        color=EMAIL_LEVEL_COLORS.get(notification.level, "#6c757d"),
+        title=html.escape(notification.title),
+        timestamp=notification.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+        message=html.escape(notification.message)
+    )
 ```
 
-class WebhookNotifier:
+class WebhookNotifier(HTTPSessionMixin):
 “”“Generic webhook notifier”””
 
 ```
-def __init__(self, config: Dict[str, Any]):
+def __init__(self, config: Dict[str, Any], session: Optional[aiohttp.ClientSession] = None):
     self.url = config.get('url')
-    self.headers = config.get('headers', {})
-    self.timeout = config.get('timeout', 10)
+    self.headers = {'Content-Type': 'application/json', **config.get('headers', {})}
+    self.timeout = aiohttp.ClientTimeout(total=config.get('timeout', 10))
+    self.session = session
 
 async def send(self, notification: Notification) -> bool:
     """Send webhook notification"""
     
     try:
-        payload = {
-            'title': notification.title,
-            'message': notification.message,
-            'level': notification.level.value,
-            'timestamp': notification.timestamp.isoformat(),
-            'data': notification.data
-        }
+        body = notification._webhook_body
+        if body is None:
+            payload = {
+                'title': notification.title,
+                'message': notification.message,
+                'level': notification.level.value,
+                'timestamp': notification.timestamp.isoformat(),
+                'data': notification.data
+            }
+            body = notification._webhook_body = _dumps(payload)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.url,
-                json=payload,
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                return response.status < 400
+        async with self._get_session().post(
+            self.url,
+            data=body,
+            headers=self.headers,
+            timeout=self.timeout
+        ) as response:
+            return response.status < 400
                 
     except Exception as e:
         logger.error("webhook_send_error", error=str(e))
         return False
 ```
 
-class DiscordNotifier:
+# Discord embed color per level
+DISCORD_LEVEL_COLORS = {
+    NotificationLevel.INFO: 0x3498db,      # Blue
+    NotificationLevel.WARNING: 0xf39c12,   # Orange
+    NotificationLevel.ERROR: 0xe74c3c,     # Red
+    NotificationLevel.CRITICAL: 0x8b0000,  # Dark Red
+    NotificationLevel.SUCCESS: 0x2ecc71    # Green
+}
+
+class DiscordNotifier(HTTPSessionMixin):
 “”“Discord webhook notifier”””
 
 ```
-def __init__(self, config: Dict[str, Any]):
+def __init__(self, config: Dict[str, Any], session: Optional[aiohttp.ClientSession] = None):
     self.webhook_url = config.get('webhook_url')
+    self.session = session
+    self.headers = {'Content-Type': 'application/json'}
     
     # Color mapping for embed
-    self.level_colors = {
-        NotificationLevel.INFO: 0x3498db,      # Blue
-        NotificationLevel.WARNING: 0xf39c12,   # Orange
-        NotificationLevel.ERROR: 0xe74c3c,     # Red
-        NotificationLevel.CRITICAL: 0x8b0000,  # Dark Red
-        NotificationLevel.SUCCESS: 0x2ecc71    # Green
-    }
+    self.level_colors = DISCORD_LEVEL_COLORS
 
 async def send(self, notification: Notification) -> bool:
     """Send Discord notification"""
     
     try:
-        color = self.level_colors.get(notification.level, 0x95a5a6)
-        
-        embed = {
-            "title": notification.title,
-            "description": notification.message,
-            "color": color,
-            "timestamp": notification.timestamp.isoformat(),
-            "footer": {
-                "text": "SmartArb Engine"
+        body = notification._discord_body
+        if body is None:
+            color = self.level_colors.get(notification.level, 0x95a5a6)
+            
+            embed = {
+                "title": notification.title,
+                "description": notification.message,
+                "color": color,
+                "timestamp": notification.timestamp.isoformat(),
+                "footer": {
+                    "text": "SmartArb Engine"
+                }
             }
-        }
-        
-        payload = {
-            "embeds": [embed]
-        }
+            
+            payload = {
+                "embeds": [embed]
+            }
+            body = notification._discord_body = _dumps(payload)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.webhook_url, json=payload) as response:
-                return response.status == 204
+        async with self._get_session().post(self.webhook_url, data=body,
+                                            headers=self.headers) as response:
+            return response.status == 204
                 
     except Exception as e:
         logger.error("discord_send_error", error=str(e))
         return False
 ```
 
+# Console line prefix per level
+CONSOLE_LEVEL_PREFIXES = {
+    NotificationLevel.INFO: "ℹ️  INFO",
+    NotificationLevel.WARNING: "⚠️  WARNING",
+    NotificationLevel.ERROR: "❌ ERROR",
+    NotificationLevel.CRITICAL: "🚨 CRITICAL",
+    NotificationLevel.SUCCESS: "✅ SUCCESS"
+}
+
 class ConsoleNotifier:
 “”“Console/stdout notifier”””
 
 ```
 def __init__(self):
-    self.level_prefixes = {
-        NotificationLevel.INFO: "ℹ️  INFO",
-        NotificationLevel.WARNING: "⚠️  WARNING",
-        NotificationLevel.ERROR: "❌ ERROR",
-        NotificationLevel.CRITICAL: "🚨 CRITICAL",
-        NotificationLevel.SUCCESS: "✅ SUCCESS"
-    }
+    self.level_prefixes = CONSOLE_LEVEL_PREFIXES
 
-async def send(self, notification: Notification) -> bool:
-    """Send console notification"""
+def send(self, notification: Notification) -> bool:
+    """Send console notification (synchronous, nothing to await)"""
     
     try:
         prefix = self.level_prefixes.get(notification.level, "📢 NOTICE")
@@ -2,16 +2,23 @@
 import urllib.request
 import urllib.parse
 import json
+import sys
 from datetime import datetime
 
 # Le tue credenziali reali (dal file .env)
 BOT_TOKEN = "8478412531:AAEvX9OdKjc7RQ9tDQUv3WnlhxUzS320U9k"
 CHAT_ID = "536544467"
 
-def test_telegram_now():
-    print("🧪 Testing SmartArb Telegram Integration...")
-    print(f"📱 Bot Token: {BOT_TOKEN[:20]}...")
-    print(f"📱 Chat ID: {CHAT_ID}")
+def send_test(out=None) -> bool:
+    """Send the test message; True once Telegram has accepted it
+
+    Progress is printed to out, stdout by default.
+    """
+    if out is None:
+        out = sys.stdout
+    print("🧪 Testing SmartArb Telegram Integration...", file=out)
+    print(f"📱 Bot Token: {BOT_TOKEN[:20]}...", file=out)
+    print(f"📱 Chat ID: {CHAT_ID}", file=out)
     
     # Current bot stats (from your running bot)
     message = """🚀 <b>SmartArb Engine - Telegram Test</b>
@@ -45,30 +52,30 @@ def test_telegram_now():
         req = urllib.request.Request(url, data=data_encoded, method='POST')
         req.add_header('Content-Type', 'application/x-www-form-urlencoded')
         
-        print("📡 Sending test message...")
+        print("📡 Sending test message...", file=out)
         with urllib.request.urlopen(req, timeout=15) as response:
             result = json.loads(response.read().decode())
             if response.status == 200:
-                print("✅ SUCCESS! Telegram message sent!")
-                print(f"📱 Message ID: {result['result']['message_id']}")
-                print(f"📱 Sent to: {result['result']['chat']['first_name']} ({result['result']['chat']['id']})")
-                print("\n🎉 CHECK YOUR TELEGRAM NOW!")
+                print("✅ SUCCESS! Telegram message sent!", file=out)
+                print(f"📱 Message ID: {result['result']['message_id']}", file=out)
+                print(f"📱 Sent to: {result['result']['chat']['first_name']} ({result['result']['chat']['id']})", file=out)
+                print("\n🎉 CHECK YOUR TELEGRAM NOW!", file=out)
                 return True
             else:
-                print(f"❌ Telegram API error: {response.status}")
-                print(f"Response: {result}")
+                print(f"❌ Telegram API error: {response.status}", file=out)
+                print(f"Response: {result}", file=out)
                 return False
                 
     except Exception as e:
-        print(f"❌ Failed to send message: {e}")
+        print(f"❌ Failed to send message: {e}", file=out)
         if "chat not found" in str(e).lower():
-            print("💡 Make sure you started the bot and sent /start")
+            print("💡 Make sure you started the bot and sent /start", file=out)
         elif "unauthorized" in str(e).lower():
-            print("💡 Check if the bot token is correct")
+            print("💡 Check if the bot token is correct", file=out)
         return False
 
 if __name__ == "__main__":
-    success = test_telegram_now()
+    success = send_test()
     if success:
         print("\n🚀 TELEGRAM INTEGRATION READY!")
         print("📱 Your SmartArb bot can now send live notifications!")
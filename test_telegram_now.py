@@ -1,30 +1,30 @@
 #!/usr/bin/env python3
 import os
-import urllib.request
-import urllib.parse
-import json
+import re
+import asyncio
+import aiohttp
 from datetime import datetime
+from functools import lru_cache
 
-def test_telegram():
-    print("🧪 Testing Telegram configuration...")
-    
-    token = os.getenv('TELEGRAM_BOT_TOKEN')
-    chat_id = os.getenv('TELEGRAM_CHAT_ID')
-    
-    if not token or not chat_id or 'your_bot' in token.lower():
-        print("❌ Configure TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID in .env first")
-        print("Current token:", token[:20] + "..." if token else "None")
-        print("Current chat_id:", chat_id)
-        return False
-    
-    # Test message with current bot stats
-    message = f"""🧪 <b>SmartArb Telegram Test</b>
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Shape of a real bot token: numeric bot id, colon, secret
+_TOKEN_RE = re.compile(r'\d+:[A-Za-z0-9_-]{30,}')
+
+# Separate connect/read deadlines so a stuck socket fails fast
+_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3, sock_read=5)
+
+# Test message with current bot stats; only the time changes per send
+_MESSAGE_TEMPLATE = """🧪 <b>SmartArb Telegram Test</b>
 
 ✅ <b>Connection:</b> Working perfectly!
 🚀 <b>Bot Status:</b> Running and profitable
 💰 <b>Performance:</b> ~$536/minute profit rate
 📈 <b>Rate:</b> 6.3 opportunities per minute
-⏰ <b>Test Time:</b> {datetime.now().strftime('%H:%M:%S')}
+⏰ <b>Test Time:</b> {ts}
 
 🔥 <i>Your trading beast is ready for notifications!</i>
 
@@ -32,33 +32,63 @@ def test_telegram():
 - Opportunities > $25 profit
 - Status reports every 30min  
 - Major milestones reached"""
+
+@lru_cache(maxsize=1)
+def _endpoint(token: str, chat_id: str):
+    """sendMessage URL and fixed form fields for one bot/chat pair"""
+    url = f"https://api.telegram.org/bot{token}/sendMessage"
+    return url, {'chat_id': chat_id, 'parse_mode': 'HTML'}
+
+async def _test_telegram_async():
+    print("🧪 Testing Telegram configuration...")
+    
+    token = os.getenv('TELEGRAM_BOT_TOKEN')
+    chat_id = os.getenv('TELEGRAM_CHAT_ID')
+    
+    if not token or not chat_id or 'your_bot' in token.lower():
+        print("❌ Configure TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID in .env first")
+        print("Current token:", token[:20] + "..." if token else "None")
+        print("Current chat_id:", chat_id)
+        return False
+    
+    # Dry run (CI): validate the token format without calling the API
+    if os.environ.get('SMARTARB_TG_DRYRUN'):
+        valid = _TOKEN_RE.fullmatch(token) is not None
+        print("✅ Token format valid (dry run)" if valid else "❌ Token format invalid (dry run)")
+        return valid
+    
+    # Test message with current bot stats
+    message = _MESSAGE_TEMPLATE.format_map({'ts': datetime.now().strftime('%H:%M:%S')})
     
     try:
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        data = {
-            'chat_id': chat_id,
-            'text': message,
-            'parse_mode': 'HTML'
-        }
+        url, static_params = _endpoint(token, chat_id)
+        data = {**static_params, 'text': message}
         
-        data_encoded = urllib.parse.urlencode(data).encode('utf-8')
-        req = urllib.request.Request(url, data=data_encoded, method='POST')
+        async with aiohttp.ClientSession(timeout=_TIMEOUT) as session:
+            async with session.post(url, data=data) as response:
+                result = json_loads(await response.read())
+                status = response.status
         
-        with urllib.request.urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode())
-            if response.status == 200:
-                print("✅ Telegram test message sent successfully!")
-                print(f"📱 Message ID: {result.get('result', {}).get('message_id', 'N/A')}")
-                return True
-            else:
-                print(f"❌ Telegram API error: {response.status}")
-                print(f"Response: {result}")
-                return False
+        if status == 200:
+            print("✅ Telegram test message sent successfully!")
+            print(f"📱 Message ID: {result.get('result', {}).get('message_id', 'N/A')}")
+            return True
+        else:
+            print(f"❌ Telegram API error: {status}")
+            print(f"Response: {result}")
+            return False
                 
+    except asyncio.TimeoutError:
+        print("❌ Telegram API timed out (connect 3s / read 5s)")
+        return False
     except Exception as e:
         print(f"❌ Failed to send test message: {e}")
         return False
 
+def test_telegram():
+    """Synchronous entry point for the command line"""
+    return asyncio.run(_test_telegram_async())
+
 if __name__ == "__main__":
     success = test_telegram()
     if success:
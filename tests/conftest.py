@@ -0,0 +1,153 @@
+"""
+Shared pytest fixtures for the SmartArb Engine test suite
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+try:
+    from pytest_asyncio_cooperative import Lock
+    HAS_COOPERATIVE = True
+except ImportError:  # async tests are not collected without the plugin
+    HAS_COOPERATIVE = False
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:  # not installed, or Windows
+    HAS_UVLOOP = False
+
+
+def pytest_configure(config):
+    """Run the async tests on uvloop when it is available
+
+    Set as a policy at configure time because the cooperative plugin creates
+    its event loop before any fixture runs.
+    """
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin serial tests to one xdist group so no two benchmarks overlap"""
+    for item in items:
+        if item.get_closest_marker('serial'):
+            item.add_marker(pytest.mark.xdist_group('serial'))
+
+
+# Cooperative async tests interleave on one loop. Tests that patch the
+# same module-level name across an await hold this lock so their patches
+# never overlap; patches only held around synchronous setup need no lock
+_PATCH_LOCK = Lock() if HAS_COOPERATIVE else None
+
+
+@pytest.fixture(scope="session")
+def global_patch_lock():
+    """Session-wide lock serialising tests that patch shared names"""
+    return _PATCH_LOCK
+
+
+# Lightweight stand-ins for the AI components, exposing only what the
+# dashboard reads; much cheaper to build than Mock(spec=...) on the real classes
+
+@dataclass(slots=True)
+class ClaudeEngineStub:
+    claude_api_key: Optional[str] = 'test_api_key'
+    model: str = 'claude-3-sonnet-20240229'
+    last_analysis_time: datetime = field(default_factory=datetime.now)
+    get_latest_recommendations: Callable = lambda: []
+    get_analysis_history: Callable = lambda: []
+
+
+@dataclass(slots=True)
+class SchedulerStub:
+    get_analysis_status: AsyncMock = field(default_factory=lambda: AsyncMock(return_value={
+        'is_running': True,
+        'total_analyses': 10,
+        'successful_analyses': 8,
+        'success_rate': 80.0,
+        'queue_size': 2,
+        'last_analysis': None
+    }))
+    request_manual_analysis: Optional[AsyncMock] = None
+    force_analysis: Optional[AsyncMock] = None
+
+
+@dataclass(slots=True)
+class CodeUpdaterStub:
+    repo: Any = None
+    pending_updates: list = field(default_factory=list)
+    get_update_history: Callable = lambda: []
+    get_available_rollbacks: Callable = lambda: []
+
+
+@pytest.fixture
+def ai_component_stubs():
+    """Claude engine, scheduler and code updater stubs for dashboard tests"""
+    return ClaudeEngineStub(), SchedulerStub(), CodeUpdaterStub()
+
+
+class NullNotificationManager:
+    """Notification manager whose every coroutine method is a no-op
+
+    Use where a test only needs notifications to succeed; unlike AsyncMock
+    it records nothing per call.
+    """
+
+    async def send_notification(self, *args, **kwargs):
+        return None
+
+    @staticmethod
+    async def _noop(*args, **kwargs):
+        return None
+
+    def __getattr__(self, name):
+        return NullNotificationManager._noop
+
+
+@pytest.fixture
+def null_notification_manager():
+    """No-op notification manager for hot-path tests"""
+    return NullNotificationManager()
+
+
+# Balances every FakeExchangeManager reports; read-only so one test cannot
+# leak changes into the next
+_FAKE_BALANCES = MappingProxyType({
+    'BTC': MappingProxyType({'free': Decimal('0.5'), 'used': Decimal('0.1'), 'total': Decimal('0.6')}),
+    'USD': MappingProxyType({'free': Decimal('10000'), 'used': Decimal('2000'), 'total': Decimal('12000')}),
+})
+
+
+class FakeExchangeManager:
+    """Exchange manager with a plain coroutine get_balance
+
+    Cheaper to build than a MagicMock with AsyncMock attributes; calls are
+    counted in get_balance_calls rather than recorded.
+    """
+
+    def __init__(self):
+        self.get_balance_calls = 0
+
+    async def get_balance(self, *args, **kwargs):
+        self.get_balance_calls += 1
+        return _FAKE_BALANCES
+
+
+@pytest.fixture
+def mock_exchange_manager():
+    """Fake exchange manager reporting fixed BTC/USD balances"""
+    return FakeExchangeManager()
+
+
+@pytest.fixture
+def healthy():
+    """get_health coroutine mock reporting a healthy component"""
+    return AsyncMock(return_value={'status': 'healthy'})
@@ -4,23 +4,56 @@ Comprehensive test suite for Claude AI system components
 """
 
 import pytest
-import asyncio
-import json
-import tempfile
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from decimal import Decimal
+from functools import lru_cache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Import AI components
-from src.ai.claude_integration import ClaudeAnalysisEngine, ClaudeRecommendation, PerformanceReport
+from src.ai.claude_integration import ClaudeAnalysisEngine, ClaudeRecommendation, PerformanceReport, AnalysisType
 from src.ai.analysis_scheduler import AIAnalysisScheduler
-from src.ai.code_updater import CodeUpdateManager
+from src.ai.code_updater import CodeUpdater, CodeUpdateManager
 from src.ai.dashboard import AIDashboard
 from src.utils.config import ConfigManager
 from src.utils.notifications import NotificationManager
 
 
+# Mock Claude responses for the parser tests
+_SAMPLE_CLAUDE_JSON = '''
+        Here's my analysis:
+        
+        ```json
+        {
+          "recommendations": [
+            {
+              "category": "risk",
+              "priority": "high", 
+              "title": "Test recommendation",
+              "description": "Test description",
+              "config_changes": {"test.param": "new_value"},
+              "expected_impact": "Test impact"
+            }
+          ]
+        }
+        ```
+        '''
+
+_EMPTY_RESPONSE = "No changes recommended at this time."
+
+_MALFORMED_RESPONSE = '''
+        ```json
+        {"recommendations": [{"category": "risk", "priority": 
+        ```
+        '''
+
+
 @pytest.fixture
 def mock_config():
     """Mock configuration manager"""
@@ -51,17 +84,25 @@ def mock_config():
     return mock_config_manager
 
 
+@lru_cache(maxsize=256)
+def _compile_path(key):
+    """Build a cached accessor for a dot-notation key"""
+    parts = tuple(key.split('.'))
+    
+    def _get(data, default=None):
+        try:
+            for part in parts:
+                data = data[part]
+            return data
+        except (KeyError, TypeError):
+            return default
+    
+    return _get
+
+
 def _get_nested_value(data, key, default=None):
     """Helper to get nested dictionary values using dot notation"""
-    keys = key.split('.')
-    value = data
-    
-    try:
-        for k in keys:
-            value = value[k]
-        return value
-    except KeyError:
-        return default
+    return _compile_path(key)(data, default)
 
 
 @pytest.fixture
@@ -146,7 +187,7 @@ def sample_recommendations():
 class TestClaudeAnalysisEngine:
     """Test Claude Analysis Engine"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_initialization(self, mock_config, mock_db_manager):
         """Test Claude engine initialization"""
         engine = ClaudeAnalysisEngine(mock_config, mock_db_manager)
@@ -156,7 +197,7 @@ class TestClaudeAnalysisEngine:
         assert engine.claude_api_key == 'test_api_key'
         assert engine.model == 'claude-3-sonnet-20240229'
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_generate_performance_report(self, mock_config, mock_db_manager):
         """Test performance report generation"""
         engine = ClaudeAnalysisEngine(mock_config, mock_db_manager)
@@ -185,7 +226,7 @@ class TestClaudeAnalysisEngine:
         assert report.success_rate >= 0
         assert isinstance(report.exchange_performance, dict)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_manual_analysis(self, mock_config, mock_db_manager):
         """Test manual analysis functionality"""
         engine = ClaudeAnalysisEngine(mock_config, mock_db_manager)
@@ -198,100 +239,89 @@ class TestClaudeAnalysisEngine:
                 'content': [{'text': 'Test analysis response'}]
             }
             mock_post.return_value.__aenter__.return_value = mock_response
-            
+        
             result = await engine.get_manual_analysis("Test prompt")
-            
+        
             assert result == 'Test analysis response'
             mock_post.assert_called_once()
     
-    def test_parse_claude_response(self, mock_config, mock_db_manager):
+    @pytest.mark.parametrize("payload,expected", [
+        (_SAMPLE_CLAUDE_JSON, 1),
+        (_EMPTY_RESPONSE, 0),
+        (_MALFORMED_RESPONSE, 0),
+    ])
+    def test_parse_claude_response(self, mock_config, mock_db_manager, payload, expected):
         """Test Claude response parsing"""
         engine = ClaudeAnalysisEngine(mock_config, mock_db_manager)
         
-        # Mock Claude response with JSON
-        response_text = '''
-        Here's my analysis:
-        
-        ```json
-        {
-          "recommendations": [
-            {
-              "category": "risk",
-              "priority": "high", 
-              "title": "Test recommendation",
-              "description": "Test description",
-              "config_changes": {"test.param": "new_value"},
-              "expected_impact": "Test impact"
-            }
-          ]
-        }
-        ```
-        '''
-        
-        recommendations = engine._parse_claude_response(response_text)
+        recommendations = engine._parse_claude_response(payload)
         
-        assert len(recommendations) == 1
-        assert recommendations[0].category == 'risk'
-        assert recommendations[0].priority == 'high'
-        assert recommendations[0].title == 'Test recommendation'
+        assert len(recommendations) == expected
+        if expected:
+            assert recommendations[0].category == 'risk'
+            assert recommendations[0].priority == 'high'
+            assert recommendations[0].title == 'Test recommendation'
 
 
 class TestAnalysisScheduler:
     """Test Analysis Scheduler"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_initialization(self, mock_config, mock_db_manager, mock_notification_manager):
         """Test scheduler initialization"""
         with patch('src.ai.analysis_scheduler.ClaudeAnalysisEngine'):
             scheduler = AIAnalysisScheduler(mock_config, mock_db_manager, mock_notification_manager)
-            
+        
             assert scheduler.config == mock_config
             assert scheduler.default_schedule == '0 6 * * *'
             assert not scheduler.is_running
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_queue_analysis(self, mock_config, mock_db_manager, mock_notification_manager):
         """Test analysis queuing"""
         with patch('src.ai.analysis_scheduler.ClaudeAnalysisEngine'):
             scheduler = AIAnalysisScheduler(mock_config, mock_db_manager, mock_notification_manager)
-            
-            await scheduler.queue_analysis('test_analysis', 'high')
-            
-            assert scheduler.analysis_queue.qsize() == 1
+        
+        await scheduler.queue_analysis('test_analysis', 'high')
+        
+        assert scheduler.analysis_queue.qsize() == 1
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_emergency_triggers(self, mock_config, mock_db_manager, mock_notification_manager):
         """Test emergency trigger detection"""
         with patch('src.ai.analysis_scheduler.ClaudeAnalysisEngine'):
             scheduler = AIAnalysisScheduler(mock_config, mock_db_manager, mock_notification_manager)
-            
-            # Mock performance data that should trigger emergency
-            with patch.object(scheduler, '_get_recent_performance_data') as mock_perf:
-                mock_perf.return_value = {
-                    'success_rate': 50.0,  # Below threshold of 60%
-                    'drawdown': -150.0,    # Below threshold of -100
-                    'avg_latency': 6000,   # Above threshold of 5000
-                    'consecutive_failures': 6  # Above threshold of 5
-                }
-                
-                should_trigger = await scheduler._check_emergency_triggers()
-                assert should_trigger
+        
+        # Mock performance data that should trigger emergency
+        with patch.object(scheduler, '_get_recent_performance_data') as mock_perf:
+            mock_perf.return_value = {
+                'success_rate': 50.0,  # Below threshold of 60%
+                'drawdown': -150.0,    # Below threshold of -100
+                'avg_latency': 6000,   # Above threshold of 5000
+                'consecutive_failures': 6  # Above threshold of 5
+            }
+        
+            should_trigger = await scheduler._check_emergency_triggers()
+            assert should_trigger
 
 
 class TestCodeUpdateManager:
     """Test Code Update Manager"""
     
-    def test_initialization(self, mock_notification_manager):
+    @pytest.fixture
+    def updater(self, mock_notification_manager, tmp_path):
+        """Fresh updater per test, backing up into the test's own directory"""
+        return CodeUpdateManager(mock_notification_manager, backup_dir=tmp_path / 'backups')
+    
+    def test_initialization(self, updater, mock_notification_manager):
         """Test code updater initialization"""
-        updater = CodeUpdateManager(mock_notification_manager)
         
         assert updater.notification_manager == mock_notification_manager
         assert updater.backup_dir.exists()
     
-    @pytest.mark.asyncio
-    async def test_safety_check(self, mock_notification_manager, sample_recommendations):
+    @pytest.mark.asyncio_cooperative
+    async def test_safety_check(self, updater, sample_recommendations):
         """Test code change safety validation"""
-        updater = CodeUpdateManager(mock_notification_manager)
         
         # Test safe recommendation
         safe_rec = sample_recommendations[0]  # Config change only
@@ -314,86 +344,64 @@ class TestCodeUpdateManager:
         safety_result = await updater._safety_check(unsafe_rec)
         assert not safety_result['safe']
     
-    def test_code_safety_validation(self, mock_notification_manager):
+    def test_code_safety_validation(self):
         """Test individual code safety checks"""
-        updater = CodeUpdateManager(mock_notification_manager)
+        updater = CodeUpdater(None, None)
         
-        # Safe code
-        safe_code = "config_value = 0.25"
-        assert updater._is_code_safe(safe_code)
+        # Safe code, including calls that only share a name with a builtin
+        assert updater._is_code_safe("config_value = 0.25")
+        assert updater._is_code_safe("pattern = re.compile(r'\\d+')")
         
         # Dangerous code
         dangerous_codes = [
             "os.system('rm -rf /')",
             "exec(user_input)",
             "eval(malicious_code)",
-            "subprocess.run(['rm', '-rf', '/'])"
+            "subprocess.run(['rm', '-rf', '/'])",
+            "getattr(__builtins__, 'ex' + 'ec')(user_input)",
+            "run = subprocess.run",
+            "().__class__.__base__.__subclasses__()",
+            "import os"
         ]
         
         for code in dangerous_codes:
             assert not updater._is_code_safe(code)
     
-    @pytest.mark.asyncio
-    async def test_backup_creation(self, mock_notification_manager):
+    @pytest.mark.asyncio_cooperative
+    async def test_backup_creation(self, updater, tmp_path):
         """Test backup creation"""
-        updater = CodeUpdateManager(mock_notification_manager)
         
-        # Create temporary test file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("# Test file content\ntest_variable = 'value'\n")
-            temp_file = Path(f.name)
+        # Create test file; the updater already backs up under tmp_path
+        temp_file = tmp_path / 'src.py'
+        temp_file.write_text("# Test file content\ntest_variable = 'value'\n")
         
-        try:
-            changes = [{'file': str(temp_file)}]
-            backup_path = await updater._create_backup('test_update', changes)
-            
-            assert backup_path is not None
-            assert backup_path.exists()
-            assert (backup_path / temp_file.name).exists()
-            
-            # Check metadata
-            metadata_file = backup_path / 'metadata.json'
-            assert metadata_file.exists()
-            
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            assert metadata['update_id'] == 'test_update'
-            assert str(temp_file) in metadata['files']
+        changes = [{'file': str(temp_file)}]
+        backup_path = await updater._create_backup('test_update', changes)
+        
+        assert backup_path is not None
+        assert backup_path.exists()
+        assert (backup_path / temp_file.name).exists()
+        
+        # Check metadata
+        metadata_file = backup_path / 'metadata.json'
+        assert metadata_file.exists()
         
-        finally:
-            # Cleanup
-            temp_file.unlink(missing_ok=True)
+        metadata = json_loads(metadata_file.read_bytes())
+        
+        assert metadata['update_id'] == 'test_update'
+        assert str(temp_file) in metadata['files']
 
 
 class TestAIDashboard:
     """Test AI Dashboard"""
     
     @pytest.fixture
-    def mock_components(self, mock_notification_manager):
+    def mock_components(self, ai_component_stubs, mock_notification_manager):
         """Create mock AI components for dashboard testing"""
-        mock_claude = Mock(spec=ClaudeAnalysisEngine)
-        mock_claude.last_analysis_time = datetime.now()
-        mock_claude.get_latest_recommendations.return_value = []
-        mock_claude.get_analysis_history.return_value = []
-        
-        mock_scheduler = Mock(spec=AIAnalysisScheduler)
-        mock_scheduler.get_analysis_status = AsyncMock(return_value={
-            'is_running': True,
-            'total_analyses': 10,
-            'successful_analyses': 8,
-            'success_rate': 80.0,
-            'queue_size': 2,
-            'last_analysis': None
-        })
-        
-        mock_code_updater = Mock(spec=CodeUpdateManager)
-        mock_code_updater.get_update_history.return_value = []
-        mock_code_updater.get_available_rollbacks.return_value = []
-        
+        mock_claude, mock_scheduler, mock_code_updater = ai_component_stubs
         return mock_claude, mock_scheduler, mock_code_updater, mock_notification_manager
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_initialization(self, mock_components):
         """Test dashboard initialization"""
         claude, scheduler, code_updater, notification_manager = mock_components
@@ -405,7 +413,7 @@ class TestAIDashboard:
         assert dashboard.code_updater == code_updater
         assert dashboard.notification_manager == notification_manager
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_dashboard_data_update(self, mock_components):
         """Test dashboard data update"""
         claude, scheduler, code_updater, notification_manager = mock_components
@@ -421,7 +429,7 @@ class TestAIDashboard:
         assert 'analysis_stats' in dashboard_data
         assert 'recommendation_overview' in dashboard_data
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_manual_analysis_request(self, mock_components):
         """Test manual analysis request through dashboard"""
         claude, scheduler, code_updater, notification_manager = mock_components
@@ -440,7 +448,7 @@ class TestAIDashboard:
 class TestIntegration:
     """Integration tests for AI system"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_full_analysis_workflow(self, mock_config, mock_db_manager, 
                                         mock_notification_manager, sample_recommendations):
         """Test complete analysis workflow"""
@@ -450,28 +458,28 @@ class TestIntegration:
             mock_claude_engine = Mock()
             mock_claude_engine.run_automated_analysis = AsyncMock(return_value=sample_recommendations)
             mock_claude_class.return_value = mock_claude_engine
-            
+        
             scheduler = AIAnalysisScheduler(mock_config, mock_db_manager, mock_notification_manager)
             code_updater = CodeUpdateManager(mock_notification_manager)
+        
+        # Queue and process analysis
+        await scheduler.queue_analysis('test_analysis')
+        
+        # Verify queue
+        assert scheduler.analysis_queue.qsize() == 1
+        
+        # Process code updates
+        with patch.object(code_updater, '_create_backup') as mock_backup:
+            with patch.object(code_updater, '_run_tests') as mock_tests:
+                mock_backup.return_value = Path('/tmp/test_backup')
+                mock_tests.return_value = True
             
-            # Queue and process analysis
-            await scheduler.queue_analysis('test_analysis')
-            
-            # Verify queue
-            assert scheduler.analysis_queue.qsize() == 1
+                results = await code_updater.process_recommendations(sample_recommendations)
             
-            # Process code updates
-            with patch.object(code_updater, '_create_backup') as mock_backup:
-                with patch.object(code_updater, '_run_tests') as mock_tests:
-                    mock_backup.return_value = Path('/tmp/test_backup')
-                    mock_tests.return_value = True
-                    
-                    results = await code_updater.process_recommendations(sample_recommendations)
-                    
-                    assert 'total_recommendations' in results
-                    assert results['total_recommendations'] == len(sample_recommendations)
+                assert 'total_recommendations' in results
+                assert results['total_recommendations'] == len(sample_recommendations)
     
-    @pytest.mark.asyncio 
+    @pytest.mark.asyncio_cooperative
     async def test_error_handling(self, mock_config, mock_db_manager, mock_notification_manager):
         """Test error handling in AI components"""
         
@@ -495,7 +503,7 @@ class TestIntegration:
         assert mock_config.get('ai.nonexistent_key', 'default') == 'default'
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_api_integration():
     """Test AI API endpoints (requires running server)"""
     
@@ -526,51 +534,47 @@ def test_cli_integration():
 class TestPerformance:
     """Performance tests for AI system"""
     
-    @pytest.mark.asyncio
-    async def test_large_recommendation_processing(self, mock_notification_manager):
+    @pytest.mark.asyncio_cooperative
+    async def test_large_recommendation_processing(self, null_notification_manager):
         """Test processing many recommendations"""
-        updater = CodeUpdateManager(mock_notification_manager)
+        updater = CodeUpdateManager(null_notification_manager)
         
         # Create many recommendations
-        large_rec_list = []
-        for i in range(100):
-            rec = ClaudeRecommendation(
+        large_rec_list = [
+            ClaudeRecommendation(
                 category='technical',
                 priority='low',
                 title=f'Recommendation {i}',
                 description=f'Description {i}',
                 config_changes={f'param_{i}': f'value_{i}'}
             )
-            large_rec_list.append(rec)
+            for i in range(100)
+        ]
         
         # Process should handle large lists efficiently
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         results = await updater.process_recommendations(large_rec_list)
-        end_time = datetime.now()
-        
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         assert processing_time < 30  # Should process in under 30 seconds
         assert results['total_recommendations'] == 100
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_concurrent_analysis_requests(self, mock_config, mock_db_manager, mock_notification_manager):
         """Test handling concurrent analysis requests"""
         
         with patch('src.ai.analysis_scheduler.ClaudeAnalysisEngine'):
             scheduler = AIAnalysisScheduler(mock_config, mock_db_manager, mock_notification_manager)
-            
-            # Queue multiple analyses concurrently
-            tasks = []
-            for i in range(10):
-                task = scheduler.queue_analysis(f'analysis_{i}', 'normal')
-                tasks.append(task)
-            
-            await asyncio.gather(*tasks)
-            
-            # Should have queued all requests
-            assert scheduler.analysis_queue.qsize() == 10
+        
+        # Queue multiple analyses in one batch
+        trigger_ids = await scheduler.trigger_analyses(
+            [(AnalysisType.PERFORMANCE_REVIEW, 'medium') for _ in range(10)]
+        )
+        
+        # Should have queued all requests
+        assert len(set(trigger_ids)) == 10
+        assert scheduler.execution_queue[-10:] == trigger_ids
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider", "--import-mode=importlib"])
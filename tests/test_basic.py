@@ -127,7 +127,7 @@ def test_profit_calculation(self):
     assert abs(profit - expected_profit) < 0.001
 ```
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio_cooperative
 async def test_async_functionality():
 “”“Test that async functionality works”””
 import asyncio
@@ -11,12 +11,8 @@ import json
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, Any, List
-import sys
-import os
-
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 # Import SmartArb components
 from src.core.engine import SmartArbEngine, EngineState
@@ -81,6 +77,28 @@ def sample_ticker_data():
         }
     }
 
+# Engine init steps patched to succeed in the initialization tests
+_ENGINE_INIT_METHODS = (
+    '_initialize_config',
+    '_initialize_database',
+    '_initialize_logging',
+    '_initialize_exchanges',
+    '_initialize_risk_manager',
+    '_initialize_portfolio_manager',
+    '_initialize_strategies',
+    '_initialize_ai_components',
+    '_initialize_monitoring',
+    '_initialize_notifications',
+)
+
+@pytest.fixture
+def engine_init_mocks():
+    """AsyncMocks for the engine init steps, fresh for each test"""
+    # spec=None skips the per-attribute coroutine scan Mock does for a spec
+    mocks = {name: AsyncMock(spec=None, return_value=True) for name in _ENGINE_INIT_METHODS}
+    mocks['get_health_status'] = AsyncMock(spec=None, return_value={'status': 'healthy'})
+    return mocks
+
 # =============================================================================
 # ENGINE CORE TESTS
 # =============================================================================
@@ -88,39 +106,28 @@ def sample_ticker_data():
 class TestSmartArbEngine:
     """Test suite for the main SmartArb Engine"""
     
-    @pytest.mark.asyncio
-    async def test_engine_initialization(self, mock_config):
+    @pytest.mark.asyncio_cooperative
+    async def test_engine_initialization(self, mock_config, engine_init_mocks):
         """Test engine initialization process"""
         with patch('src.core.engine.ConfigManager') as mock_config_manager:
             mock_config_manager.return_value.load_all_configs = AsyncMock()
             mock_config_manager.return_value.validate_critical_configs = MagicMock(return_value=True)
-            
+        
             engine = SmartArbEngine()
-            
-            # Test initial state
-            assert engine.state == EngineState.STOPPED
-            assert engine.emergency_stop_triggered is False
-            assert engine.metrics.error_count == 0
-            
-            # Mock all initialization methods to succeed
-            with patch.multiple(engine,
-                                _initialize_config=AsyncMock(return_value=True),
-                                _initialize_database=AsyncMock(return_value=True),
-                                _initialize_logging=AsyncMock(return_value=True),
-                                _initialize_exchanges=AsyncMock(return_value=True),
-                                _initialize_risk_manager=AsyncMock(return_value=True),
-                                _initialize_portfolio_manager=AsyncMock(return_value=True),
-                                _initialize_strategies=AsyncMock(return_value=True),
-                                _initialize_ai_components=AsyncMock(return_value=True),
-                                _initialize_monitoring=AsyncMock(return_value=True),
-                                _initialize_notifications=AsyncMock(return_value=True),
-                                get_health_status=AsyncMock(return_value={'status': 'healthy'})):
-                
-                result = await engine.initialize()
-                assert result is True
-                assert engine.state == EngineState.STARTING
+        
+        # Test initial state
+        assert engine.state == EngineState.STOPPED
+        assert engine.emergency_stop_triggered is False
+        assert engine.metrics.error_count == 0
+        
+        # Mock all initialization methods to succeed
+        with patch.multiple(engine, **engine_init_mocks):
+        
+            result = await engine.initialize()
+            assert result is True
+            assert engine.state == EngineState.STARTING
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_engine_initialization_failure(self):
         """Test engine initialization failure handling"""
         engine = SmartArbEngine()
@@ -134,20 +141,15 @@ class TestSmartArbEngine:
                 assert engine.state == EngineState.ERROR
                 cleanup_mock.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_engine_health_check(self):
+    @pytest.mark.asyncio_cooperative
+    async def test_engine_health_check(self, healthy):
         """Test comprehensive health check functionality"""
         engine = SmartArbEngine()
         
-        # Mock components
-        engine.database_manager = MagicMock()
-        engine.database_manager.get_health = AsyncMock(return_value={'status': 'healthy'})
-        
-        engine.exchange_manager = MagicMock()
-        engine.exchange_manager.get_health = AsyncMock(return_value={'status': 'healthy'})
-        
-        engine.strategy_manager = MagicMock()
-        engine.strategy_manager.get_health = AsyncMock(return_value={'status': 'healthy'})
+        # Stub components sharing one prebuilt health mock
+        engine.database_manager = SimpleNamespace(get_health=healthy)
+        engine.exchange_manager = SimpleNamespace(get_health=healthy)
+        engine.strategy_manager = SimpleNamespace(get_health=healthy)
         
         health = await engine.get_health_status()
         
@@ -157,20 +159,15 @@ class TestSmartArbEngine:
         assert 'system' in health
         assert 'trading' in health
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_engine_emergency_stop(self):
         """Test emergency stop functionality"""
         engine = SmartArbEngine()
         
-        # Mock components
-        engine.strategy_manager = MagicMock()
-        engine.strategy_manager.emergency_stop = AsyncMock()
-        
-        engine.exchange_manager = MagicMock()
-        engine.exchange_manager.cancel_all_orders = AsyncMock()
-        
-        engine.notification_service = MagicMock()
-        engine.notification_service.send_notification = AsyncMock()
+        # Mock components; plain namespaces hold the few AsyncMocks needed
+        engine.strategy_manager = SimpleNamespace(emergency_stop=AsyncMock())
+        engine.exchange_manager = SimpleNamespace(cancel_all_orders=AsyncMock())
+        engine.notification_service = SimpleNamespace(send_notification=AsyncMock())
         
         # Mock shutdown method
         with patch.object(engine, 'shutdown', AsyncMock()) as shutdown_mock:
@@ -186,6 +183,12 @@ class TestSmartArbEngine:
 # ARBITRAGE CALCULATION TESTS
 # =============================================================================
 
+# Shared Decimal inputs, parsed once for the whole module
+_BTC_PRICE = Decimal('50000.00')
+_FEE_TAKER = Decimal('0.001')  # 0.1%
+_FEE_TAKER_HIGH = Decimal('0.0025')  # 0.25%
+_TOLERANCE = Decimal('0.01')
+
 class TestArbitrageCalculator:
     """Test suite for arbitrage calculations"""
     
@@ -194,11 +197,11 @@ class TestArbitrageCalculator:
         calc = ArbitrageCalculator()
         
         # Test profitable arbitrage opportunity
-        buy_price = Decimal('50000.00')
+        buy_price = _BTC_PRICE
         sell_price = Decimal('50250.00')
         amount = Decimal('0.1')
-        buy_fee = Decimal('0.0025')  # 0.25%
-        sell_fee = Decimal('0.001')  # 0.1%
+        buy_fee = _FEE_TAKER_HIGH
+        sell_fee = _FEE_TAKER
         
         profit = calc.calculate_profit(buy_price, sell_price, amount, buy_fee, sell_fee)
         
@@ -206,7 +209,7 @@ class TestArbitrageCalculator:
         # = 5019.975 - 5001.25 = 18.725
         expected_profit = Decimal('18.725')
         
-        assert abs(profit - expected_profit) < Decimal('0.01')
+        assert abs(profit - expected_profit) < _TOLERANCE
         assert profit > 0
     
     def test_unprofitable_arbitrage(self):
@@ -214,11 +217,11 @@ class TestArbitrageCalculator:
         calc = ArbitrageCalculator()
         
         # Prices too close for profit after fees
-        buy_price = Decimal('50000.00')
+        buy_price = _BTC_PRICE
         sell_price = Decimal('50050.00')  # Only $50 difference
         amount = Decimal('0.1')
-        buy_fee = Decimal('0.0025')
-        sell_fee = Decimal('0.001')
+        buy_fee = _FEE_TAKER_HIGH
+        sell_fee = _FEE_TAKER
         
         profit = calc.calculate_profit(buy_price, sell_price, amount, buy_fee, sell_fee)
         
@@ -228,11 +231,11 @@ class TestArbitrageCalculator:
         """Test percentage profit calculation"""
         calc = ArbitrageCalculator()
         
-        buy_price = Decimal('50000.00')
+        buy_price = _BTC_PRICE
         sell_price = Decimal('50500.00')  # 1% higher
         amount = Decimal('1.0')
-        buy_fee = Decimal('0.001')
-        sell_fee = Decimal('0.001')
+        buy_fee = _FEE_TAKER
+        sell_fee = _FEE_TAKER
         
         profit = calc.calculate_profit(buy_price, sell_price, amount, buy_fee, sell_fee)
         percentage = calc.calculate_profit_percentage(profit, buy_price, amount)
@@ -244,20 +247,20 @@ class TestArbitrageCalculator:
         """Test minimum profit threshold checking"""
         calc = ArbitrageCalculator()
         
-        buy_price = Decimal('50000.00')
+        buy_price = _BTC_PRICE
         sell_price = Decimal('50100.00')
         amount = Decimal('0.1')
         min_threshold = Decimal('0.5')  # 0.5% minimum
         
         result = calc.meets_profit_threshold(
             buy_price, sell_price, amount, 
-            Decimal('0.001'), Decimal('0.001'), 
+            _FEE_TAKER, _FEE_TAKER, 
             min_threshold
         )
         
         # Calculate expected profit percentage
         profit = calc.calculate_profit(buy_price, sell_price, amount, 
-                                     Decimal('0.001'), Decimal('0.001'))
+                                     _FEE_TAKER, _FEE_TAKER)
         percentage = calc.calculate_profit_percentage(profit, buy_price, amount)
         
         assert result == (percentage >= min_threshold)
@@ -269,7 +272,7 @@ class TestArbitrageCalculator:
         with pytest.raises(ValueError):
             calc.calculate_profit(
                 Decimal('50000'), Decimal('50100'), 
-                Decimal('0'), Decimal('0.001'), Decimal('0.001')
+                Decimal('0'), _FEE_TAKER, _FEE_TAKER
             )
     
     def test_edge_case_negative_prices(self):
@@ -279,7 +282,7 @@ class TestArbitrageCalculator:
         with pytest.raises(ValueError):
             calc.calculate_profit(
                 Decimal('-50000'), Decimal('50100'), 
-                Decimal('0.1'), Decimal('0.001'), Decimal('0.001')
+                Decimal('0.1'), _FEE_TAKER, _FEE_TAKER
             )
 
 # =============================================================================
@@ -301,7 +304,7 @@ class TestRiskManager:
             'emergency_stop_loss': Decimal('200.00')
         }
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_position_size_calculation(self, risk_config):
         """Test position size calculation with risk limits"""
         risk_manager = RiskManager(risk_config)
@@ -317,7 +320,7 @@ class TestRiskManager:
         assert allowed_size <= risk_config['max_position_size']
         assert allowed_size > 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_daily_loss_limit(self, risk_config):
         """Test daily loss limit enforcement"""
         risk_manager = RiskManager(risk_config)
@@ -333,7 +336,7 @@ class TestRiskManager:
         result = risk_manager.check_daily_loss_limit(Decimal('30.00'))
         assert result is False
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_emergency_stop_trigger(self, risk_config):
         """Test emergency stop trigger conditions"""
         risk_manager = RiskManager(risk_config)
@@ -346,7 +349,7 @@ class TestRiskManager:
         assert risk_status['emergency_stop'] is True
         assert 'daily_loss_exceeded' in risk_status['reasons']
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_exchange_exposure_limit(self, risk_config):
         """Test per-exchange exposure limits"""
         risk_manager = RiskManager(risk_config)
@@ -362,7 +365,7 @@ class TestRiskManager:
         result = risk_manager.check_exchange_exposure('kraken', Decimal('100.00'))
         assert result is False
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_correlation_risk(self, risk_config):
         """Test correlation risk management"""
         risk_manager = RiskManager(risk_config)
@@ -388,17 +391,7 @@ class TestRiskManager:
 class TestPortfolioManager:
     """Test suite for portfolio management"""
     
-    @pytest.fixture
-    def mock_exchange_manager(self):
-        """Mock exchange manager for testing"""
-        mock = MagicMock()
-        mock.get_balance = AsyncMock(return_value={
-            'BTC': {'free': Decimal('0.5'), 'used': Decimal('0.1'), 'total': Decimal('0.6')},
-            'USD': {'free': Decimal('10000'), 'used': Decimal('2000'), 'total': Decimal('12000')}
-        })
-        return mock
-    
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_balance_refresh(self, mock_exchange_manager):
         """Test balance refresh functionality"""
         portfolio = PortfolioManager(mock_exchange_manager, None, None)
@@ -408,9 +401,9 @@ class TestPortfolioManager:
         assert 'BTC' in portfolio.balances['kraken']  # Assuming kraken is first exchange
         assert 'USD' in portfolio.balances['kraken']
         
-        mock_exchange_manager.get_balance.assert_called()
+        assert mock_exchange_manager.get_balance_calls > 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_position_tracking(self, mock_exchange_manager):
         """Test position tracking and updates"""
         portfolio = PortfolioManager(mock_exchange_manager, None, None)
@@ -437,7 +430,7 @@ class TestPortfolioManager:
         
         assert portfolio.positions[0]['size'] == Decimal('0.05')
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_portfolio_valuation(self, mock_exchange_manager, sample_ticker_data):
         """Test portfolio valuation calculation"""
         portfolio = PortfolioManager(mock_exchange_manager, None, None)
@@ -461,7 +454,7 @@ class TestPortfolioManager:
             
             assert abs(total_value - expected_value) < Decimal('1')
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_pnl_calculation(self, mock_exchange_manager):
         """Test profit and loss calculation"""
         portfolio = PortfolioManager(mock_exchange_manager, None, None)
@@ -493,58 +486,60 @@ class TestPortfolioManager:
 class TestExchangeIntegration:
     """Test suite for exchange integrations"""
     
-    @pytest.mark.asyncio
-    async def test_exchange_connection(self):
+    @pytest.mark.asyncio_cooperative
+    async def test_exchange_connection(self, global_patch_lock):
         """Test exchange connection handling"""
-        with patch('src.exchanges.kraken.ccxt.kraken') as mock_kraken:
-            mock_instance = MagicMock()
-            mock_kraken.return_value = mock_instance
-            mock_instance.fetch_ticker = AsyncMock(return_value={
-                'symbol': 'BTC/USD',
-                'bid': 50000.0,
-                'ask': 50100.0,
-                'timestamp': int(time.time() * 1000)
-            })
+        async with global_patch_lock():
+            with patch('src.exchanges.kraken.ccxt.kraken') as mock_kraken:
+                mock_instance = MagicMock()
+                mock_kraken.return_value = mock_instance
+                mock_instance.fetch_ticker = AsyncMock(return_value={
+                    'symbol': 'BTC/USD',
+                    'bid': 50000.0,
+                    'ask': 50100.0,
+                    'timestamp': int(time.time() * 1000)
+                })
             
-            from src.exchanges.kraken import KrakenExchange
+                from src.exchanges.kraken import KrakenExchange
             
-            exchange = KrakenExchange({
-                'api_key': 'test_key',
-                'api_secret': 'test_secret',
-                'sandbox': True
-            })
+                exchange = KrakenExchange({
+                    'api_key': 'test_key',
+                    'api_secret': 'test_secret',
+                    'sandbox': True
+                })
             
-            await exchange.initialize()
-            ticker = await exchange.fetch_ticker('BTC/USD')
+                await exchange.initialize()
+                ticker = await exchange.fetch_ticker('BTC/USD')
             
-            assert ticker['symbol'] == 'BTC/USD'
-            assert ticker['bid'] < ticker['ask']
-            assert ticker['timestamp'] > 0
+                assert ticker['symbol'] == 'BTC/USD'
+                assert ticker['bid'] < ticker['ask']
+                assert ticker['timestamp'] > 0
     
-    @pytest.mark.asyncio
-    async def test_exchange_error_handling(self):
+    @pytest.mark.asyncio_cooperative
+    async def test_exchange_error_handling(self, global_patch_lock):
         """Test exchange error handling"""
-        with patch('src.exchanges.kraken.ccxt.kraken') as mock_kraken:
-            mock_instance = MagicMock()
-            mock_kraken.return_value = mock_instance
+        async with global_patch_lock():
+            with patch('src.exchanges.kraken.ccxt.kraken') as mock_kraken:
+                mock_instance = MagicMock()
+                mock_kraken.return_value = mock_instance
             
-            # Simulate network error
-            mock_instance.fetch_ticker = AsyncMock(side_effect=Exception("Network error"))
+                # Simulate network error
+                mock_instance.fetch_ticker = AsyncMock(side_effect=Exception("Network error"))
             
-            from src.exchanges.kraken import KrakenExchange
+                from src.exchanges.kraken import KrakenExchange
             
-            exchange = KrakenExchange({
-                'api_key': 'test_key',
-                'api_secret': 'test_secret',
-                'sandbox': True
-            })
+                exchange = KrakenExchange({
+                    'api_key': 'test_key',
+                    'api_secret': 'test_secret',
+                    'sandbox': True
+                })
             
-            await exchange.initialize()
+                await exchange.initialize()
             
-            with pytest.raises(Exception):
-                await exchange.fetch_ticker('BTC/USD')
+                with pytest.raises(Exception):
+                    await exchange.fetch_ticker('BTC/USD')
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_rate_limiting(self):
         """Test rate limiting functionality"""
         with patch('src.exchanges.base.BaseExchange') as MockExchange:
@@ -566,7 +561,7 @@ class TestExchangeIntegration:
 class TestArbitrageStrategy:
     """Test suite for arbitrage strategies"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_opportunity_detection(self, sample_ticker_data):
         """Test arbitrage opportunity detection"""
         strategy = ArbitrageStrategy({
@@ -589,7 +584,7 @@ class TestArbitrageStrategy:
         assert btc_opp is not None
         assert btc_opp['profit_percentage'] > 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_opportunity_execution(self):
         """Test arbitrage opportunity execution"""
         strategy = ArbitrageStrategy({
@@ -641,37 +636,37 @@ class TestArbitrageStrategy:
 class TestErrorHandling:
     """Test suite for error handling and edge cases"""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_network_timeout_handling(self):
         """Test network timeout handling"""
         with patch('aiohttp.ClientSession.get') as mock_get:
             mock_get.side_effect = asyncio.TimeoutError()
-            
+        
             from src.exchanges.base import BaseExchange
-            
+        
             exchange = BaseExchange({'timeout': 5})
-            
+        
             with pytest.raises(asyncio.TimeoutError):
                 await exchange.fetch_ticker('BTC/USD')
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_database_connection_failure(self):
         """Test database connection failure handling"""
         with patch('asyncpg.connect') as mock_connect:
             mock_connect.side_effect = ConnectionError("Database unavailable")
-            
+        
             from src.database.manager import DatabaseManager
-            
+        
             db_manager = DatabaseManager({
                 'host': 'localhost',
                 'port': 5432,
                 'database': 'test_db'
             })
-            
+        
             with pytest.raises(ConnectionError):
                 await db_manager.initialize()
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_api_key_validation(self):
         """Test API key validation"""
         from src.exchanges.kraken import KrakenExchange
@@ -690,20 +685,27 @@ class TestErrorHandling:
                 'api_secret': 'test_secret'
             })
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_memory_leak_prevention(self):
         """Test memory leak prevention in long-running operations"""
         # This test would be more comprehensive in a real scenario
         import gc
         import sys
         
+        gc.collect()
         initial_objects = len(gc.get_objects())
         
-        # Simulate multiple trading cycles
-        for _ in range(100):
-            # Create and destroy objects that might leak
-            data = {'large_data': list(range(1000))}
-            del data
+        # Keep opportunistic collections out of the measured window
+        gc.disable()
+        try:
+            # Simulate multiple trading cycles
+            for _ in range(100):
+                # Create and destroy objects that might leak; one contiguous
+                # buffer per cycle rather than 1000 boxed ints
+                data = {'large_data': np.arange(1000)}
+                del data
+        finally:
+            gc.enable()
         
         gc.collect()
         final_objects = len(gc.get_objects())
@@ -718,21 +720,25 @@ class TestErrorHandling:
 class TestPerformance:
     """Test suite for performance benchmarks"""
     
-    @pytest.mark.asyncio
-    async def test_arbitrage_calculation_performance(self):
+    @pytest.mark.serial
+    def test_arbitrage_calculation_performance(self):
         """Test arbitrage calculation performance"""
         calc = ArbitrageCalculator()
         
+        buy_price = Decimal('50000')
+        sell_price = Decimal('50100')
+        amount = Decimal('0.1')
+        
         start_time = time.time()
         
         # Run 1000 calculations
         for i in range(1000):
             calc.calculate_profit(
-                Decimal('50000'), 
-                Decimal('50100') + Decimal(i),
-                Decimal('0.1'),
-                Decimal('0.001'),
-                Decimal('0.001')
+                buy_price, 
+                sell_price + Decimal(i),
+                amount,
+                _FEE_TAKER,
+                _FEE_TAKER
             )
         
         end_time = time.time()
@@ -745,19 +751,23 @@ class TestPerformance:
         ops_per_second = 1000 / execution_time
         assert ops_per_second > 1000  # Should be > 1000 ops/sec
     
-    @pytest.mark.asyncio
-    async def test_concurrent_exchange_requests(self):
+    @pytest.mark.serial
+    def test_concurrent_exchange_requests(self):
         """Test concurrent exchange request performance"""
-        # Mock multiple exchange requests
+        # Runs on its own loop: under the shared cooperative loop other
+        # tests' work would land inside the timed window
         async def mock_request():
             await asyncio.sleep(0.1)  # Simulate network delay
             return {'status': 'success'}
         
+        async def run_concurrently():
+            # Run 10 concurrent requests
+            tasks = [mock_request() for _ in range(10)]
+            return await asyncio.gather(*tasks)
+        
         start_time = time.time()
         
-        # Run 10 concurrent requests
-        tasks = [mock_request() for _ in range(10)]
-        results = await asyncio.gather(*tasks)
+        results = asyncio.run(run_concurrently())
         
         end_time = time.time()
         execution_time = end_time - start_time
@@ -773,8 +783,9 @@ class TestPerformance:
 class TestIntegration:
     """Integration tests for complete workflows"""
     
-    @pytest.mark.asyncio
-    async def test_complete_arbitrage_workflow(self, mock_config, sample_ticker_data):
+    @pytest.mark.asyncio_cooperative
+    async def test_complete_arbitrage_workflow(self, mock_config, sample_ticker_data,
+                                               engine_init_mocks):
         """Test complete arbitrage workflow from detection to execution"""
         # This is a simplified integration test
         # In practice, you'd want more comprehensive testing
@@ -783,27 +794,16 @@ class TestIntegration:
             mock_config_manager.return_value.load_all_configs = AsyncMock()
             mock_config_manager.return_value.validate_critical_configs = MagicMock(return_value=True)
             mock_config_manager.return_value.get_exchanges_config = MagicMock(return_value=mock_config['exchanges'])
-            
+        
             engine = SmartArbEngine()
-            
-            # Mock successful initialization
-            with patch.multiple(engine,
-                                _initialize_config=AsyncMock(return_value=True),
-                                _initialize_database=AsyncMock(return_value=True),
-                                _initialize_logging=AsyncMock(return_value=True),
-                                _initialize_exchanges=AsyncMock(return_value=True),
-                                _initialize_risk_manager=AsyncMock(return_value=True),
-                                _initialize_portfolio_manager=AsyncMock(return_value=True),
-                                _initialize_strategies=AsyncMock(return_value=True),
-                                _initialize_ai_components=AsyncMock(return_value=True),
-                                _initialize_monitoring=AsyncMock(return_value=True),
-                                _initialize_notifications=AsyncMock(return_value=True),
-                                get_health_status=AsyncMock(return_value={'status': 'healthy'})):
-                
-                result = await engine.initialize()
-                assert result is True
+        
+        # Mock successful initialization
+        with patch.multiple(engine, **engine_init_mocks):
+        
+            result = await engine.initialize()
+            assert result is True
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio_cooperative
     async def test_error_recovery_workflow(self):
         """Test error recovery and resilience"""
         engine = SmartArbEngine()
@@ -833,7 +833,6 @@ if __name__ == "__main__":
         __file__,
         "-v",
         "--tb=short",
-        "--asyncio-mode=auto",
         "--cov=src",
         "--cov-report=html",
         "--cov-report=term-missing"
@@ -4,9 +4,8 @@ Test Configuration Management
 Tests for SmartArb Engine configuration loading and validation
 “””
 
+import io
 import pytest
-import tempfile
-import yaml
 from pathlib import Path
 import os
 import sys
@@ -17,6 +16,53 @@ sys.path.insert(0, str(Path(**file**).parent.parent))
 
 from src.utils.config import ConfigManager, ConfigValidationResult
 
+# Built once per module; from_dict copies its input, so they are never mutated
+_VALID_CFG = {
+    'engine': {
+        'name': 'Test Engine',
+        'version': '1.0.0'
+    },
+    'logging': {
+        'log_level': 'INFO',
+        'log_directory': 'logs'
+    },
+    'risk_management': {
+        'max_daily_loss': 50,
+        'max_position_size': 1000
+    },
+    'exchanges': {
+        'test_exchange': {
+            'enabled': True,
+            'api_key': 'valid_key',
+            'api_secret': 'valid_secret'
+        }
+    },
+    'strategies': {
+        'spatial_arbitrage': {
+            'enabled': True,
+            'min_spread_percent': 0.2
+        }
+    }
+}
+
+_INVALID_CFG = {
+    'engine': {
+        'name': 'Test Engine'
+        # Missing required fields
+    },
+    'logging': {
+        'log_level': 'INVALID_LEVEL'  # Invalid log level
+    },
+    'exchanges': {
+        'test_exchange': {
+            'enabled': True,
+            'api_key': 'your_api_key_here',  # Placeholder value
+            'api_secret': ''  # Missing secret
+        }
+    }
+    # Missing required sections
+}
+
 class TestConfigManager:
 “”“Test configuration management functionality”””
 
@@ -24,250 +70,162 @@ class TestConfigManager:
 def test_config_manager_initialization(self):
     """Test basic configuration manager initialization"""
     
-    # Create temporary config file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        test_config = {
-            'engine': {
-                'name': 'Test Engine',
-                'version': '1.0.0'
-            },
-            'logging': {
-                'log_level': 'INFO'
-            }
+    config_manager = ConfigManager.from_dict({
+        'engine': {
+            'name': 'Test Engine',
+            'version': '1.0.0'
+        },
+        'logging': {
+            'log_level': 'INFO'
         }
-        yaml.dump(test_config, f)
-        config_path = f.name
+    })
     
-    try:
-        # Initialize config manager
-        config_manager = ConfigManager(config_path)
-        
-        # Check if config loaded
-        config = config_manager.get_config()
-        assert config is not None
-        assert config['engine']['name'] == 'Test Engine'
-        assert config['logging']['log_level'] == 'INFO'
-        
-    finally:
-        # Cleanup
-        os.unlink(config_path)
+    # Check if config loaded
+    config = config_manager.get_config()
+    assert config is not None
+    assert config['engine']['name'] == 'Test Engine'
+    assert config['logging']['log_level'] == 'INFO'
 
-def test_environment_variable_substitution(self):
+def test_environment_variable_substitution(self, monkeypatch):
     """Test environment variable substitution in config"""
     
-    # Set test environment variable
-    os.environ['TEST_API_KEY'] = 'test_key_123'
+    # Set test environment variable; restored at teardown
+    monkeypatch.setenv('TEST_API_KEY', 'test_key_123')
+    monkeypatch.delenv('NONEXISTENT_VAR', raising=False)
     
-    # Create config with environment variable
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        f.write("""
-```
-
-engine:
-name: “Test Engine”
-exchanges:
-test:
-api_key: “${TEST_API_KEY}”
-fallback: “${NONEXISTENT_VAR:default_value}”
-“””)
-config_path = f.name
-
-```
-    try:
-        config_manager = ConfigManager(config_path)
-        config = config_manager.get_config()
-        
-        # Check substitution worked
-        assert config['exchanges']['test']['api_key'] == 'test_key_123'
-        assert config['exchanges']['test']['fallback'] == 'default_value'
-        
-    finally:
-        os.unlink(config_path)
-        del os.environ['TEST_API_KEY']
+    # Config with environment variable, parsed from YAML text
+    config_manager = ConfigManager.from_stream(io.StringIO(
+        'engine:\n'
+        '  name: "Test Engine"\n'
+        'exchanges:\n'
+        '  test:\n'
+        '    api_key: "${TEST_API_KEY}"\n'
+        '    fallback: "${NONEXISTENT_VAR:default_value}"\n'
+        '  ${TEST_API_KEY}:\n'
+        '    enabled: false\n'
+    ))
+    config = config_manager.get_config()
+    
+    # Check substitution worked
+    assert config['exchanges']['test']['api_key'] == 'test_key_123'
+    assert config['exchanges']['test']['fallback'] == 'default_value'
+    
+    # Keys are never substituted
+    assert config['exchanges']['${TEST_API_KEY}'] == {'enabled': False}
 
 def test_config_validation_valid(self):
     """Test configuration validation with valid config"""
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        valid_config = {
-            'engine': {
-                'name': 'Test Engine',
-                'version': '1.0.0'
-            },
-            'logging': {
-                'log_level': 'INFO',
-                'log_directory': 'logs'
-            },
-            'risk_management': {
-                'max_daily_loss': 50,
-                'max_position_size': 1000
-            },
-            'exchanges': {
-                'test_exchange': {
-                    'enabled': True,
-                    'api_key': 'valid_key',
-                    'api_secret': 'valid_secret'
-                }
-            },
-            'strategies': {
-                'spatial_arbitrage': {
-                    'enabled': True,
-                    'min_spread_percent': 0.2
-                }
-            }
-        }
-        yaml.dump(valid_config, f)
-        config_path = f.name
+    config_manager = ConfigManager.from_dict(_VALID_CFG)
+    validation_result = config_manager.validate_config()
     
-    try:
-        config_manager = ConfigManager(config_path)
-        validation_result = config_manager.validate_config()
-        
-        assert isinstance(validation_result, ConfigValidationResult)
-        assert validation_result.valid is True
-        
-    finally:
-        os.unlink(config_path)
+    assert isinstance(validation_result, ConfigValidationResult)
+    assert validation_result.valid is True
 
 def test_config_validation_invalid(self):
     """Test configuration validation with invalid config"""
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        invalid_config = {
-            'engine': {
-                'name': 'Test Engine'
-                # Missing required fields
-            },
-            'logging': {
-                'log_level': 'INVALID_LEVEL'  # Invalid log level
-            },
-            'exchanges': {
-                'test_exchange': {
-                    'enabled': True,
-                    'api_key': 'your_api_key_here',  # Placeholder value
-                    'api_secret': ''  # Missing secret
-                }
-            }
-            # Missing required sections
-        }
-        yaml.dump(invalid_config, f)
-        config_path = f.name
+    config_manager = ConfigManager.from_dict(_INVALID_CFG)
+    validation_result = config_manager.validate_config()
     
-    try:
-        config_manager = ConfigManager(config_path)
-        validation_result = config_manager.validate_config()
-        
-        assert isinstance(validation_result, ConfigValidationResult)
-        assert len(validation_result.errors) > 0
-        assert len(validation_result.warnings) > 0
-        
-    finally:
-        os.unlink(config_path)
+    assert isinstance(validation_result, ConfigValidationResult)
+    assert len(validation_result.errors) > 0
+    assert validation_result.warnings == [
+        'test_exchange: api_key is a placeholder',
+        'test_exchange: api_secret is not set'
+    ]
+
+def test_config_validation_fail_fast(self):
+    """Test fail-fast validation stops at the missing sections"""
+
+    config_manager = ConfigManager.from_dict({
+        'logging': {'log_level': 'INVALID_LEVEL'},
+        'exchanges': {'test_exchange': {'enabled': True, 'api_key': ''}}
+    })
+    validation_result = config_manager.validate_config(fail_fast=True)
+
+    assert validation_result.valid is False
+    assert len(validation_result.errors) == 1
+    assert 'risk_management' in validation_result.errors[0]
+    assert validation_result.warnings == []
 
 def test_exchange_config_access(self):
     """Test exchange configuration access"""
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        config = {
-            'exchanges': {
-                'kraken': {
-                    'enabled': True,
-                    'api_key': 'kraken_key',
-                    'rate_limit': 15
-                },
-                'bybit': {
-                    'enabled': False,
-                    'api_key': 'bybit_key',
-                    'rate_limit': 120
-                }
+    config_manager = ConfigManager.from_dict({
+        'exchanges': {
+            'kraken': {
+                'enabled': True,
+                'api_key': 'kraken_key',
+                'rate_limit': 15
+            },
+            'bybit': {
+                'enabled': False,
+                'api_key': 'bybit_key',
+                'rate_limit': 120
             }
         }
-        yaml.dump(config, f)
-        config_path = f.name
+    })
     
-    try:
-        config_manager = ConfigManager(config_path)
-        
-        # Test getting specific exchange config
-        kraken_config = config_manager.get_exchange_config('kraken')
-        assert kraken_config['enabled'] is True
-        assert kraken_config['api_key'] == 'kraken_key'
-        assert kraken_config['rate_limit'] == 15
-        
-        bybit_config = config_manager.get_exchange_config('bybit')
-        assert bybit_config['enabled'] is False
-        
-        # Test getting non-existent exchange
-        nonexistent_config = config_manager.get_exchange_config('nonexistent')
-        assert nonexistent_config == {}
-        
-    finally:
-        os.unlink(config_path)
+    # Test getting specific exchange config
+    kraken_config = config_manager.get_exchange_config('kraken')
+    assert kraken_config['enabled'] is True
+    assert kraken_config['api_key'] == 'kraken_key'
+    assert kraken_config['rate_limit'] == 15
+    
+    bybit_config = config_manager.get_exchange_config('bybit')
+    assert bybit_config['enabled'] is False
+    
+    # Test getting non-existent exchange
+    nonexistent_config = config_manager.get_exchange_config('nonexistent')
+    assert nonexistent_config == {}
 
 def test_strategy_config_access(self):
     """Test strategy configuration access"""
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        config = {
-            'strategies': {
-                'spatial_arbitrage': {
-                    'enabled': True,
-                    'min_spread_percent': 0.2,
-                    'max_position_size': 1000
-                },
-                'triangular_arbitrage': {
-                    'enabled': False,
-                    'min_profit_percent': 0.15
-                }
+    config_manager = ConfigManager.from_dict({
+        'strategies': {
+            'spatial_arbitrage': {
+                'enabled': True,
+                'min_spread_percent': 0.2,
+                'max_position_size': 1000
+            },
+            'triangular_arbitrage': {
+                'enabled': False,
+                'min_profit_percent': 0.15
             }
         }
-        yaml.dump(config, f)
-        config_path = f.name
+    })
+    
+    # Test getting specific strategy config
+    spatial_config = config_manager.get_strategy_config('spatial_arbitrage')
+    assert spatial_config['enabled'] is True
+    assert spatial_config['min_spread_percent'] == 0.2
     
-    try:
-        config_manager = ConfigManager(config_path)
-        
-        # Test getting specific strategy config
-        spatial_config = config_manager.get_strategy_config('spatial_arbitrage')
-        assert spatial_config['enabled'] is True
-        assert spatial_config['min_spread_percent'] == 0.2
-        
-        triangular_config = config_manager.get_strategy_config('triangular_arbitrage')
-        assert triangular_config['enabled'] is False
-        
-        # Test getting non-existent strategy
-        nonexistent_config = config_manager.get_strategy_config('nonexistent')
-        assert nonexistent_config == {}
-        
-    finally:
-        os.unlink(config_path)
+    triangular_config = config_manager.get_strategy_config('triangular_arbitrage')
+    assert triangular_config['enabled'] is False
+    
+    # Test getting non-existent strategy
+    nonexistent_config = config_manager.get_strategy_config('nonexistent')
+    assert nonexistent_config == {}
 
 def test_config_update(self):
     """Test configuration updates"""
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        config = {
-            'engine': {
-                'name': 'Test Engine',
-                'debug_mode': False
-            }
+    config_manager = ConfigManager.from_dict({
+        'engine': {
+            'name': 'Test Engine',
+            'debug_mode': False
         }
-        yaml.dump(config, f)
-        config_path = f.name
+    })
     
-    try:
-        config_manager = ConfigManager(config_path)
-        
-        # Update configuration
-        success = config_manager.update_config('engine', 'debug_mode', True)
-        assert success is True
-        
-        # Check if update was applied
-        updated_config = config_manager.get_config()
-        assert updated_config['engine']['debug_mode'] is True
-        
-    finally:
-        os.unlink(config_path)
+    # Update configuration
+    success = config_manager.update_config('engine', 'debug_mode', True)
+    assert success is True
+    
+    # Check if update was applied
+    updated_config = config_manager.get_config()
+    assert updated_config['engine']['debug_mode'] is True
 
 def test_default_config_fallback(self):
     """Test fallback to default configuration"""
@@ -282,64 +240,43 @@ def test_default_config_fallback(self):
     assert 'logging' in config
     assert 'risk_management' in config
 
-def test_env_file_loading(self):
+def test_env_file_loading(self, tmp_path, monkeypatch):
     """Test .env file loading"""
     
-    # Create temporary .env file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-        f.write("""
-```
-
-# Test environment file
-
-TEST_VAR1=value1
-TEST_VAR2=“quoted value”
-TEST_VAR3=‘single quoted’
-
-# Comment line
-
-TEST_VAR4=value4
-“””)
-env_path = f.name
-
-```
-    # Temporarily move to temp directory
-    original_cwd = os.getcwd()
-    temp_dir = os.path.dirname(env_path)
+    # .env is read from the working directory, so this test keeps real
+    # files, in a directory of its own
+    (tmp_path / '.env').write_text(
+        '# Test environment file\n'
+        'TEST_VAR1=value1\n'
+        'TEST_VAR2="quoted value"\n'
+        "TEST_VAR3='single quoted'\n"
+        '# Comment line\n'
+        'TEST_VAR4=value4\n'
+    )
+    config_path = tmp_path / 'test_config.yaml'
+    config_path.write_text(
+        'test:\n'
+        '  var1: "${TEST_VAR1}"\n'
+        '  var2: "${TEST_VAR2}"\n'
+        '  var3: "${TEST_VAR3}"\n'
+    )
     
-    try:
-        os.chdir(temp_dir)
-        os.rename(env_path, os.path.join(temp_dir, '.env'))
-        
-        # Create config that uses env vars
-        config_path = os.path.join(temp_dir, 'test_config.yaml')
-        with open(config_path, 'w') as f:
-            f.write("""
-```
-
-test:
-var1: “${TEST_VAR1}”
-var2: “${TEST_VAR2}”
-var3: “${TEST_VAR3}”
-“””)
-
-```
-        config_manager = ConfigManager(config_path)
-        config = config_manager.get_config()
-        
-        assert config['test']['var1'] == 'value1'
-        assert config['test']['var2'] == 'quoted value'
-        assert config['test']['var3'] == 'single quoted'
-        
-    finally:
-        os.chdir(original_cwd)
-        # Cleanup
-        try:
-            os.unlink(os.path.join(temp_dir, '.env'))
-            os.unlink(config_path)
-        except:
-            pass
+    # Restored at teardown
+    monkeypatch.chdir(tmp_path)
+    for name in ('TEST_VAR1', 'TEST_VAR2', 'TEST_VAR3', 'TEST_VAR4'):
+        monkeypatch.delenv(name, raising=False)
+    
+    config_manager = ConfigManager(str(config_path))
+    config = config_manager.get_config()
+    
+    assert config['test']['var1'] == 'value1'
+    assert config['test']['var2'] == 'quoted value'
+    assert config['test']['var3'] == 'single quoted'
+    assert config_manager.env['TEST_VAR4'] == 'value4'
+    
+    # .env values stay with the instance
+    assert 'TEST_VAR1' not in os.environ
 ```
 
 if **name** == “**main**”:
-pytest.main([**file**])
\ No newline at end of file
+pytest.main([**file**])